@@ -0,0 +1,72 @@
+"""
+Benchmark comparando o join_columns com o build_composite_key (concatenação com separador e hash de 64 bits).
+
+Execução (a partir da pasta cloud_common_lib):
+    python -m benchmarks.bench_composite_key --rows 10000000 --columns 3
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.PandasDFManipulation import PandasDFManipulation
+
+
+def create_key_dataframe(rows: int, columns: int, seed: int = 42):
+    """
+    Função para criar um DataFrame com colunas alternando entre texto e inteiros, usadas para compor a chave.
+
+    Parâmetros:
+        rows (int): Quantidade de linhas.
+        columns (int): Quantidade de colunas.
+        seed (int): Semente do gerador de números aleatórios.
+
+    Retorno:
+        pd.DataFrame: DataFrame gerado.
+    """
+    rng = np.random.default_rng(seed)
+    texts = np.array([f'cliente_{i}' for i in range(100000)], dtype=object)
+    data = {}
+    for i in range(columns):
+        if i % 2 == 0:
+            data[f'coluna_{i}'] = texts[rng.integers(0, len(texts), rows)]
+        else:
+            data[f'coluna_{i}'] = rng.integers(0, 1000000, rows)
+    return pd.DataFrame(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000000)
+    parser.add_argument('--columns', type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    df = create_key_dataframe(args.rows, max(args.columns, 2))
+    columns = list(df.columns)
+    cases = {
+        'join_columns (2 colunas)':
+            lambda: PandasDFManipulation.join_columns(df, columns[0], columns[1], 'chave'),
+        'build_composite_key (2 colunas)':
+            lambda: PandasDFManipulation.build_composite_key(df, columns[:2], 'chave'),
+        'build_composite_key hashed (2 colunas)':
+            lambda: PandasDFManipulation.build_composite_key(df, columns[:2], 'chave', hashed=True),
+        f'build_composite_key ({len(columns)} colunas)':
+            lambda: PandasDFManipulation.build_composite_key(df, columns, 'chave'),
+        f'build_composite_key hashed ({len(columns)} colunas)':
+            lambda: PandasDFManipulation.build_composite_key(df, columns, 'chave', hashed=True),
+    }
+    print(f'{args.rows} linhas')
+    for name, function in cases.items():
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        memory = df['chave'].memory_usage(deep=True, index=False) / 1024 ** 2
+        print(f'{name:<45} {elapsed:>8.2f}s  {args.rows / elapsed:>14,.0f} linhas/s  {memory:>10.1f} MB')
+        del df['chave']
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark do tempo de importação (cold start) de cada módulo da biblioteca, utilizando o python -X importtime em um
+processo novo por execução. Para cada módulo é reportado o tempo acumulado da importação e as dependências mais
+pesadas carregadas por ela; com --use, os recursos pesados são acessados após o import, mostrando o custo que passa
+a ser pago apenas no primeiro uso.
+
+Execução (a partir da pasta cloud_common_lib):
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --modules PandasDFManipulation MongoManipulation --top 5 --use
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = ['Utils', 'Logging', 'Resources', 'FileManipulation', 'PandasDFManipulation', 'MongoManipulation',
+           'PostgresManipulation', 'COSManipulation', 'Instrumentation', 'lib_teste']
+
+# Acesso que força o carregamento das dependências importadas de forma preguiçosa
+USAGE = {
+    'FileManipulation': 'm.pd.DataFrame; m.ciphers.Cipher',
+    'PandasDFManipulation': 'm.pd.DataFrame',
+    'MongoManipulation': 'm.pymongo.MongoClient; m.pd.DataFrame',
+    'PostgresManipulation': 'm.sqlalchemy.create_engine; m.pd.DataFrame',
+    'COSManipulation': 'm.ibm_boto3.resource; m.pd.DataFrame',
+}
+
+
+def parse_importtime(stderr: str):
+    """
+    Função para interpretar a saída do -X importtime.
+
+    Parâmetros:
+        stderr (str): Saída de erro do processo.
+
+    Retorno:
+        list: Tuplas (módulo, nível de aninhamento, tempo próprio em us, tempo acumulado em us).
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        # Cada nível de aninhamento acrescenta dois espaços antes do nome
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), depth, int(self_time), int(cumulative)))
+    return imports
+
+
+def measure_import(module: str, use: bool):
+    """
+    Função para medir a importação de um módulo em um processo novo.
+
+    Parâmetros:
+        module (str): Nome do módulo dentro de src.
+        use (bool): Se True, acessa também as dependências pesadas do módulo após o import.
+
+    Retorno:
+        dict: {'import_ms', 'elapsed_ms', 'imports'} ou {'error'} se o módulo não puder ser importado.
+    """
+    code = f'import time; start = time.perf_counter(); import src.{module} as m'
+    if use and module in USAGE:
+        code += f'; {USAGE[module]}'
+    code += '; print(time.perf_counter() - start)'
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=PROJECT_DIR,
+                             capture_output=True, text=True)
+    if process.returncode != 0:
+        return {'error': process.stderr.strip().splitlines()[-1]}
+    imports = parse_importtime(process.stderr)
+    import_us = next(cumulative for name, _, _, cumulative in imports if name == f'src.{module}')
+    return {
+        'import_ms': round(import_us / 1000, 2),
+        # Import e, com --use, o primeiro acesso às dependências (inclui o overhead do -X importtime)
+        'elapsed_ms': round(float(process.stdout.strip().splitlines()[-1]) * 1000, 2),
+        'imports': imports
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modules', nargs='*', default=MODULES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=3, help='Quantidade de dependências mais pesadas exibidas')
+    parser.add_argument('--use', action='store_true', help='Acessa as dependências pesadas após o import')
+    parser.add_argument('--output', default=None, help='Arquivo JSON onde os resultados serão gravados')
+    args = parser.parse_args()
+
+    results = {}
+    for module in args.modules:
+        runs = [measure_import(module, args.use) for _ in range(args.repeat)]
+        errors = [run for run in runs if 'error' in run]
+        if errors:
+            results[module] = {'error': errors[0]['error']}
+            print(f'{module:<25} erro: {errors[0]["error"]}')
+            continue
+        best = min(runs, key=lambda run: run['elapsed_ms'])
+        dependencies = [item for item in best['imports'] if item[1] <= 1 and not item[0].startswith('src')]
+        heaviest = sorted(dependencies, key=lambda item: -item[3])[:args.top]
+        results[module] = {
+            'import_ms': best['import_ms'],
+            'elapsed_ms': best['elapsed_ms'],
+            'heaviest': {name: round(cumulative / 1000, 2) for name, _, _, cumulative in heaviest}
+        }
+        description = ', '.join(f'{name} {ms:.1f} ms' for name, ms in results[module]['heaviest'].items())
+        print(f'{module:<25} import {best["import_ms"]:>8.1f} ms   total {best["elapsed_ms"]:>8.1f} ms   '
+              f'{description}')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version.split()[0], 'use': args.use, 'modules': results}, f, indent=2)
+        print(f'Resultados gravados em {args.output}')
+
+
+if __name__ == '__main__':
+    main()
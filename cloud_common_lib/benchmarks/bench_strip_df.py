@@ -0,0 +1,89 @@
+"""
+Benchmark comparando o strip_df (regex em todas as células) com o strip_string_columns (vetorizado, apenas colunas
+string).
+
+Execução (a partir da pasta cloud_common_lib):
+    python -m benchmarks.bench_strip_df --rows 200000 --string-columns 20 --numeric-columns 20
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.PandasDFManipulation import PandasDFManipulation
+
+
+def create_wide_dataframe(rows: int, string_columns: int, numeric_columns: int, cardinality: int, seed: int = 42):
+    """
+    Função para criar um DataFrame largo com colunas string (com espaços no início e no fim) e colunas numéricas.
+
+    Parâmetros:
+        rows (int): Quantidade de linhas.
+        string_columns (int): Quantidade de colunas string.
+        numeric_columns (int): Quantidade de colunas numéricas.
+        cardinality (int): Quantidade de valores distintos de cada coluna string.
+        seed (int): Semente do gerador de números aleatórios.
+
+    Retorno:
+        pd.DataFrame: DataFrame gerado.
+    """
+    rng = np.random.default_rng(seed)
+    values = np.array([f'  valor {i} ' for i in range(cardinality)], dtype=object)
+    data = {}
+    for i in range(string_columns):
+        data[f'texto_{i}'] = values[rng.integers(0, cardinality, rows)]
+    for i in range(numeric_columns):
+        data[f'numero_{i}'] = rng.random(rows)
+    return pd.DataFrame(data)
+
+
+def measure(function, df: pd.DataFrame, repeat: int):
+    """
+    Função para medir o melhor tempo de execução de uma função sobre cópias do DataFrame.
+
+    Parâmetros:
+        function (callable): Função que recebe o DataFrame.
+        df (pd.DataFrame): DataFrame original, que não é alterado.
+        repeat (int): Quantidade de execuções.
+
+    Retorno:
+        float: Menor tempo de execução em segundos.
+    """
+    timings = []
+    for _ in range(repeat):
+        df_copy = df.copy()
+        start = time.perf_counter()
+        function(df_copy)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--string-columns', type=int, default=20)
+    parser.add_argument('--numeric-columns', type=int, default=20)
+    parser.add_argument('--cardinality', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    df = create_wide_dataframe(args.rows, args.string_columns, args.numeric_columns, args.cardinality)
+    cases = {
+        'strip_df (regex)': PandasDFManipulation.strip_df,
+        'strip_string_columns': PandasDFManipulation.strip_string_columns,
+        'strip_string_columns (use_categories)':
+            lambda df_copy: PandasDFManipulation.strip_string_columns(df_copy, use_categories=True),
+    }
+    print(f'{args.rows} linhas, {args.string_columns} colunas string, {args.numeric_columns} colunas numéricas')
+    baseline = None
+    for name, function in cases.items():
+        elapsed = measure(function, df, args.repeat)
+        baseline = baseline or elapsed
+        print(f'{name:<40} {elapsed:>9.3f}s  {baseline / elapsed:>6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""
+Substitutos locais dos backends utilizados pelos benchmarks, para executá-los sem acesso à IBM Cloud:
+
+    - COS: armazenamento S3 em memória com a parte da API do ibm_boto3 utilizada pelo COSManipulation.
+    - MongoDB: mongomock.
+    - PostgreSQL: SQLite em arquivos temporários, com um banco anexado para cada schema.
+
+As classes de manipulação reais são utilizadas; apenas as conexões são trocadas. Se o SDK de um backend não estiver
+instalado (ex: ibm_boto3 ou sqlalchemy), a criação levanta ImportError e os casos correspondentes são ignorados.
+"""
+import io
+import os
+import shutil
+
+
+class FakeBody(io.BytesIO):
+    """
+    Corpo de um objeto (StreamingBody), file-like com read().
+    """
+
+
+class FakeObjectSummary:
+    def __init__(self, store: dict, bucket_name: str, key: str):
+        self.bucket_name = bucket_name
+        self.key = key
+        self.size = len(store[bucket_name][key])
+
+
+class FakeObject:
+    def __init__(self, store: dict, bucket_name: str, key: str):
+        self.store = store
+        self.bucket_name = bucket_name
+        self.key = key
+
+    def get(self):
+        return {'Body': FakeBody(self.store[self.bucket_name][self.key])}
+
+    def put(self, Body=b''):
+        self.store.setdefault(self.bucket_name, {})[self.key] = Body.encode('utf-8') if isinstance(Body, str) else Body
+
+    def delete(self):
+        self.store.get(self.bucket_name, {}).pop(self.key, None)
+
+
+class FakeObjects:
+    def __init__(self, store: dict, bucket_name: str):
+        self.store = store
+        self.bucket_name = bucket_name
+
+    def all(self):
+        return self.filter()
+
+    def filter(self, Prefix='', Delimiter=None):
+        keys = sorted(key for key in self.store.get(self.bucket_name, {}) if key.startswith(Prefix))
+        if Delimiter:
+            keys = [key for key in keys if Delimiter not in key[len(Prefix):]]
+        return [FakeObjectSummary(self.store, self.bucket_name, key) for key in keys]
+
+
+class FakeBucket:
+    def __init__(self, store: dict, name: str):
+        self.store = store
+        self.name = name
+        self.objects = FakeObjects(store, name)
+
+    def download_file(self, key, filename):
+        with open(filename, 'wb') as f:
+            f.write(self.store[self.name][key])
+
+
+class FakeBuckets:
+    def __init__(self, store: dict):
+        self.store = store
+
+    def all(self):
+        return [FakeBucket(self.store, name) for name in sorted(self.store)]
+
+
+class FakeCOSResource:
+    """
+    Equivalente em memória do ibm_boto3.resource('s3').
+    """
+
+    def __init__(self, store: dict):
+        self.store = store
+        self.buckets = FakeBuckets(store)
+
+    def Object(self, bucket_name, key):
+        return FakeObject(self.store, bucket_name, key)
+
+    def Bucket(self, name):
+        return FakeBucket(self.store, name)
+
+
+class FakeCOSClient:
+    """
+    Equivalente em memória do ibm_boto3.client('s3').
+    """
+
+    def __init__(self, store: dict):
+        self.store = store
+
+    def upload_file(self, Filename, Bucket, Key):
+        with open(Filename, 'rb') as f:
+            self.store.setdefault(Bucket, {})[Key] = f.read()
+
+    def download_fileobj(self, Bucket, Key, Fileobj):
+        shutil.copyfileobj(io.BytesIO(self.store[Bucket][Key]), Fileobj)
+
+
+def create_cos(bucket_name: str = 'benchmark'):
+    """
+    Função para criar um COSManipulation conectado a um armazenamento em memória.
+
+    Parâmetros:
+        bucket_name (str): Nome do bucket (definido na variável de ambiente cos_bucket_name).
+
+    Retorno:
+        COSManipulation: Instância utilizando o FakeCOSResource e o FakeCOSClient.
+    """
+    from src.COSManipulation import COSManipulation
+
+    os.environ['cos_bucket_name'] = bucket_name
+    store = {bucket_name: {}}
+    cos = COSManipulation.__new__(COSManipulation)
+    cos._cos = FakeCOSResource(store)
+    cos._cos_client = FakeCOSClient(store)
+    return cos
+
+
+def create_mongo(database: str = 'benchmark'):
+    """
+    Função para criar um MongoManipulation conectado ao mongomock.
+
+    Parâmetros:
+        database (str): Nome da database.
+
+    Retorno:
+        MongoManipulation: Instância utilizando um mongomock.MongoClient.
+    """
+    import mongomock
+    from src.MongoManipulation import MongoManipulation
+
+    mongo = MongoManipulation.__new__(MongoManipulation)
+    mongo.client = mongomock.MongoClient()
+    mongo.database = database
+    return mongo
+
+
+def create_postgres(directory: str, schemas: list = None):
+    """
+    Função para criar um PostgresManipulation utilizando SQLite, com um banco anexado para cada schema.
+
+    Parâmetros:
+        directory (str): Diretório onde os arquivos do SQLite serão criados.
+        schemas (list): Schemas disponíveis. Padrão são os schemas permitidos pelo validate_schema.
+
+    Retorno:
+        PostgresManipulation: Instância utilizando o engine do SQLite.
+    """
+    import sqlalchemy
+    from src.PostgresManipulation import PostgresManipulation
+
+    schemas = schemas or ['agroinsights', 'agroinsights_relatorios', 'exploratory', 'exploratory-reports']
+    engine = sqlalchemy.create_engine(f"sqlite:///{os.path.join(directory, 'main.db')}")
+
+    @sqlalchemy.event.listens_for(engine, 'connect')
+    def attach_schemas(dbapi_connection, connection_record):
+        for schema in schemas:
+            dbapi_connection.execute(f"ATTACH DATABASE '{os.path.join(directory, schema + '.db')}' AS \"{schema}\"")
+
+    class SQLitePostgresManipulation(PostgresManipulation):
+        # A conexão já é criada com o SQLite e os schemas já existem como bancos anexados
+        def connect_postgres(self):
+            pass
+
+        def schema_exists(self, schema_name: str):
+            pass
+
+    postgres = SQLitePostgresManipulation()
+    postgres.engine = engine
+    return postgres
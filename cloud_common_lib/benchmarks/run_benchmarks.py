@@ -0,0 +1,464 @@
+"""
+Suíte de benchmarks dos principais caminhos de leitura, escrita e transformação da biblioteca, executada sem acesso
+à IBM Cloud (ver benchmarks/fakes.py): COS em memória, MongoDB com mongomock e PostgreSQL com SQLite.
+
+Para cada caso é medido o melhor tempo entre as repetições, a vazão (linhas/s) e o pico de memória alocada pelo
+Python durante a execução (tracemalloc, em uma execução adicional para não interferir no tempo). Os resultados podem
+ser gravados em JSON e utilizados como baseline: com --baseline, casos mais lentos ou com pico de memória maior que a
+tolerância encerram o processo com código 1. Compare baselines gerados na mesma máquina e com o mesmo --rows.
+Os tempos dos casos de COS, MongoDB e PostgreSQL incluem o custo dos substitutos locais e servem para acompanhar a
+evolução da própria biblioteca, não a latência dos serviços reais.
+
+Execução (a partir da pasta cloud_common_lib):
+    python -m benchmarks.run_benchmarks --rows 100000 --output benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --rows 100000 --baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --cases pandas. mongo.
+"""
+import argparse
+import base64
+import functools
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from benchmarks import fakes
+from benchmarks.bench_composite_key import create_key_dataframe
+from benchmarks.bench_strip_df import create_wide_dataframe
+from src.FileManipulation import FileManipulation
+from src.PandasDFManipulation import PandasDFManipulation
+
+LAYERS = ['exploratory', 'features', 'raw', 'refined', 'sandbox', 'trusted']
+ENCRYPTION_KEY = base64.b64encode(bytes(range(32))).decode('utf-8')
+
+CASES = []
+
+
+def case(name: str, setup=None):
+    """
+    Decorator para registrar um caso de benchmark.
+
+    Parâmetros:
+        name (str): Nome do caso, prefixado pelo grupo (ex: 'pandas.strip_df').
+        setup (callable): Função que recebe a quantidade de linhas e prepara os dados de cada execução (fora da
+                          medição). O retorno é passado para o caso.
+
+    Retorno:
+        callable: Função registrada, que recebe o retorno do setup e retorna a quantidade de linhas processadas.
+    """
+    def register(function):
+        CASES.append((name, setup, function))
+        return function
+    return register
+
+
+@functools.lru_cache(maxsize=None)
+def create_sales_dataframe(rows: int, seed: int = 42):
+    """
+    Função para criar um DataFrame sintético de vendas, com colunas de texto, numéricas e de data.
+
+    Parâmetros:
+        rows (int): Quantidade de linhas.
+        seed (int): Semente do gerador de números aleatórios.
+
+    Retorno:
+        pd.DataFrame: DataFrame gerado (compartilhado entre os casos, use uma cópia se for alterá-lo).
+    """
+    rng = np.random.default_rng(seed)
+    clientes = np.array([f' cliente {i} ' for i in range(max(rows // 10, 1))], dtype=object)
+    estados = np.array(['AC', 'BA', 'GO', 'MG', 'MT', 'PR', 'RJ', 'RS', 'SC', 'SP'], dtype=object)
+    dias = np.array([f'2024-01-{day:02d}' for day in range(1, 31)], dtype=object)
+    return pd.DataFrame({
+        'id': np.arange(rows),
+        'cliente': clientes[rng.integers(0, len(clientes), rows)],
+        'estado': estados[rng.integers(0, len(estados), rows)],
+        'dia': dias[rng.integers(0, len(dias), rows)],
+        'quantidade': rng.integers(1, 100, rows),
+        'valor': rng.random(rows) * 1000
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def create_sales_csv(rows: int):
+    """
+    Função para gravar o DataFrame de vendas em CSV no diretório de execução.
+
+    Retorno:
+        str: Caminho do arquivo.
+    """
+    file = f'files/raw/vendas_{rows}.csv'
+    create_sales_dataframe(rows).to_csv(file, index=False)
+    return file
+
+
+@functools.lru_cache(maxsize=None)
+def backend(name: str):
+    """
+    Função para criar (uma única vez) o backend local informado: 'cos', 'mongo' ou 'postgres'.
+    """
+    if name == 'cos':
+        return fakes.create_cos()
+    if name == 'mongo':
+        return fakes.create_mongo()
+    directory = os.path.join(os.getcwd(), 'postgres')
+    os.makedirs(directory, exist_ok=True)
+    return fakes.create_postgres(directory)
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# PandasDFManipulation
+# ---------------------------------------------------------------------------------------------------------------------
+
+def setup_wide(rows):
+    return create_wide_dataframe_cached(rows).copy()
+
+
+@functools.lru_cache(maxsize=None)
+def create_wide_dataframe_cached(rows):
+    return create_wide_dataframe(rows, string_columns=10, numeric_columns=10, cardinality=1000)
+
+
+@functools.lru_cache(maxsize=None)
+def create_key_dataframe_cached(rows):
+    return create_key_dataframe(rows, 3)
+
+
+@case('pandas.strip_df', setup_wide)
+def bench_strip_df(df):
+    PandasDFManipulation.strip_df(df)
+    return len(df)
+
+
+@case('pandas.strip_string_columns', setup_wide)
+def bench_strip_string_columns(df):
+    PandasDFManipulation.strip_string_columns(df)
+    return len(df)
+
+
+@case('pandas.join_columns', lambda rows: create_key_dataframe_cached(rows).copy())
+def bench_join_columns(df):
+    PandasDFManipulation.join_columns(df, 'coluna_0', 'coluna_1', 'chave')
+    return len(df)
+
+
+@case('pandas.build_composite_key', lambda rows: create_key_dataframe_cached(rows).copy())
+def bench_build_composite_key(df):
+    PandasDFManipulation.build_composite_key(df, list(df.columns), 'chave')
+    return len(df)
+
+
+@case('pandas.build_composite_key_hashed', lambda rows: create_key_dataframe_cached(rows).copy())
+def bench_build_composite_key_hashed(df):
+    PandasDFManipulation.build_composite_key(df, list(df.columns), 'chave', hashed=True)
+    return len(df)
+
+
+@case('pandas.create_dataframe_from_file', create_sales_csv)
+def bench_create_dataframe_from_file(file):
+    return len(PandasDFManipulation.create_dataframe_from_file(file, ','))
+
+
+@case('pandas.profile_dataframe', create_sales_dataframe)
+def bench_profile_dataframe(df):
+    PandasDFManipulation.profile_dataframe(df)
+    return len(df)
+
+
+@case('pandas.optimize_memory', lambda rows: create_sales_dataframe(rows).copy())
+def bench_optimize_memory(df):
+    PandasDFManipulation.optimize_memory(df)
+    return len(df)
+
+
+@case('pandas.detect_changes', create_sales_dataframe)
+def bench_detect_changes(df):
+    PandasDFManipulation.detect_changes(df, ['id'])
+    return len(df)
+
+
+@case('pandas.sample_file', lambda rows: (create_sales_csv(rows), rows))
+def bench_sample_file(state):
+    file, rows = state
+    PandasDFManipulation.sample_file(file, 1000, random_state=42)
+    return rows
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# FileManipulation
+# ---------------------------------------------------------------------------------------------------------------------
+
+def setup_clean_file(rows):
+    file = 'files/sandbox/clean_file.csv'
+    shutil.copyfile(create_sales_csv(rows), file)
+    return file, rows
+
+
+@case('file.clean_file', setup_clean_file)
+def bench_clean_file(state):
+    file, rows = state
+    FileManipulation.clean_file(file)
+    return rows
+
+
+@case('file.encrypt_column', lambda rows: create_sales_dataframe(rows)[['cliente']].copy())
+def bench_encrypt_column(df):
+    FileManipulation.encrypt_column(df, 'cliente', ENCRYPTION_KEY)
+    return len(df)
+
+
+def setup_partitioned(rows):
+    shutil.rmtree('files/trusted/vendas', ignore_errors=True)
+    return create_sales_dataframe(rows)
+
+
+@case('file.write_partitioned_dataset', setup_partitioned)
+def bench_write_partitioned_dataset(df):
+    FileManipulation.write_partitioned_dataset(df, 'trusted', 'vendas', ['dia'])
+    return len(df)
+
+
+def setup_read_partitioned(rows):
+    FileManipulation.write_partitioned_dataset(setup_partitioned(rows), 'trusted', 'vendas', ['dia'])
+
+
+@case('file.read_partitioned_dataset', setup_read_partitioned)
+def bench_read_partitioned_dataset(_):
+    return len(FileManipulation.read_partitioned_dataset('trusted', 'vendas'))
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# MongoManipulation (mongomock)
+# ---------------------------------------------------------------------------------------------------------------------
+
+def setup_mongo(rows):
+    mongo = backend('mongo')
+    if mongo.client[mongo.database]['vendas'].estimated_document_count() != rows:
+        mongo.insert_data_into_mongo_from_df(create_sales_dataframe(rows).copy(), 'vendas', drop_collection=True)
+    return mongo, rows
+
+
+@case('mongo.insert_data_into_mongo_from_df', lambda rows: (backend('mongo'), create_sales_dataframe(rows).copy()))
+def bench_mongo_insert(state):
+    mongo, df = state
+    mongo.insert_data_into_mongo_from_df(df, 'vendas_insert', drop_collection=True)
+    return len(df)
+
+
+@case('mongo.aggregate_mongo', setup_mongo)
+def bench_mongo_aggregate(state):
+    mongo, rows = state
+    pipeline = [{'$group': {'_id': '$estado', 'valor': {'$sum': '$valor'}, 'quantidade': {'$sum': '$quantidade'}}}]
+    mongo.aggregate_mongo('vendas', pipeline, as_dataframe=True)
+    return rows
+
+
+@case('mongo.parallel_export_mongo', setup_mongo)
+def bench_mongo_parallel_export(state):
+    mongo, rows = state
+    return len(mongo.parallel_export_mongo('vendas', field='id', n_ranges=4))
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# COSManipulation (armazenamento em memória)
+# ---------------------------------------------------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def create_sales_csv_content(rows):
+    return create_sales_dataframe(rows).to_csv(index=False)
+
+
+def setup_cos(rows):
+    cos = backend('cos')
+    cos.create_text_file_cos('vendas.csv', 'raw/', create_sales_csv_content(rows))
+    return cos, rows
+
+
+@case('cos.create_text_file_cos', lambda rows: (backend('cos'), create_sales_csv_content(rows), rows))
+def bench_cos_write(state):
+    cos, content, rows = state
+    cos.create_text_file_cos('vendas.csv', 'raw/', content)
+    return rows
+
+
+@case('cos.create_dataframe_from_file_on_cos', setup_cos)
+def bench_cos_read(state):
+    cos, rows = state
+    return len(cos.create_dataframe_from_file_on_cos('raw/vendas.csv'))
+
+
+@case('cos.sample_file', setup_cos)
+def bench_cos_sample(state):
+    cos, rows = state
+    PandasDFManipulation.sample_file(cos.open_file_stream_cos('raw/vendas.csv'), 1000, random_state=42)
+    return rows
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# PostgresManipulation (SQLite)
+# ---------------------------------------------------------------------------------------------------------------------
+
+@case('postgres.insert_data_into_postgres_from_df', lambda rows: (backend('postgres'), create_sales_dataframe(rows)))
+def bench_postgres_insert(state):
+    postgres, df = state
+    postgres.insert_data_into_postgres_from_df(df, 'exploratory', 'vendasInsert', 'replace')
+    return len(df)
+
+
+def setup_postgres(rows):
+    postgres = backend('postgres')
+    postgres.insert_data_into_postgres_from_df(create_sales_dataframe(rows), 'exploratory', 'vendas', 'replace')
+    return postgres
+
+
+@case('postgres.create_dataframe_from_table_postgres', setup_postgres)
+def bench_postgres_read(postgres):
+    return len(postgres.create_dataframe_from_table_postgres('vendas', 'exploratory'))
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Execução
+# ---------------------------------------------------------------------------------------------------------------------
+
+def run_case(setup, function, rows: int, repeat: int):
+    """
+    Função para executar um caso, retornando o melhor tempo, as linhas processadas e o pico de memória.
+
+    Retorno:
+        dict: {'seconds', 'rows', 'rows_per_second', 'peak_memory_mb'}
+    """
+    timings = []
+    processed = 0
+    for _ in range(repeat):
+        state = setup(rows) if setup else None
+        start = time.perf_counter()
+        processed = function(state)
+        timings.append(time.perf_counter() - start)
+
+    state = setup(rows) if setup else None
+    tracemalloc.start()
+    try:
+        function(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    seconds = min(timings)
+    return {
+        'seconds': round(seconds, 6),
+        'rows': int(processed or 0),
+        'rows_per_second': round(processed / seconds, 1) if processed and seconds else None,
+        'peak_memory_mb': round(peak / 1024 ** 2, 3)
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float, memory_tolerance: float):
+    """
+    Função para comparar os resultados com um baseline.
+
+    Retorno:
+        list: Mensagens das regressões encontradas.
+    """
+    regressions = []
+    for name, result in results['cases'].items():
+        reference = baseline.get('cases', {}).get(name)
+        if not reference or 'seconds' not in result or 'seconds' not in reference:
+            continue
+        if reference['seconds'] and result['seconds'] > reference['seconds'] * (1 + tolerance):
+            regressions.append(f"{name}: tempo {reference['seconds']:.3f}s -> {result['seconds']:.3f}s")
+        if reference['peak_memory_mb'] and \
+                result['peak_memory_mb'] > reference['peak_memory_mb'] * (1 + memory_tolerance):
+            regressions.append(f"{name}: memória {reference['peak_memory_mb']:.1f} MB -> "
+                               f"{result['peak_memory_mb']:.1f} MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cases', nargs='*', default=None,
+                        help='Prefixos dos casos que serão executados (ex: pandas. mongo.aggregate)')
+    parser.add_argument('--output', default=None, help='Arquivo JSON onde os resultados serão gravados')
+    parser.add_argument('--baseline', default=None, help='Arquivo JSON com os resultados de referência')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Aumento de tempo tolerado em relação ao baseline (default 0.2 = 20%%)')
+    parser.add_argument('--memory-tolerance', type=float, default=0.1,
+                        help='Aumento de pico de memória tolerado em relação ao baseline (default 0.1 = 10%%)')
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    output = os.path.abspath(args.output) if args.output else None
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    cwd = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix='cloud_common_lib_bench_')
+    os.chdir(work_dir)
+    for layer in LAYERS:
+        os.makedirs(os.path.join('files', layer), exist_ok=True)
+
+    results = {
+        'meta': {
+            'rows': args.rows,
+            'repeat': args.repeat,
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'cases': {}
+    }
+    try:
+        print(f'{args.rows} linhas, {args.repeat} repetições')
+        for name, setup, function in CASES:
+            if args.cases and not any(name.startswith(prefix) for prefix in args.cases):
+                continue
+            try:
+                result = run_case(setup, function, args.rows, args.repeat)
+            except ImportError as e:
+                results['cases'][name] = {'skipped': str(e)}
+                print(f'{name:<50} ignorado ({e})')
+                continue
+            results['cases'][name] = result
+            throughput = f"{result['rows_per_second']:>14,.0f} linhas/s" if result['rows_per_second'] else ''
+            print(f"{name:<50} {result['seconds']:>9.3f}s {throughput} {result['peak_memory_mb']:>10.1f} MB")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if output:
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f'Resultados gravados em {output}')
+
+    if baseline is not None:
+        if baseline.get('meta', {}).get('rows') != args.rows:
+            print(f"Aviso: baseline gerado com {baseline.get('meta', {}).get('rows')} linhas")
+        regressions = compare(results, baseline, args.tolerance, args.memory_tolerance)
+        for regression in regressions:
+            print(f'REGRESSÃO {regression}')
+        if regressions:
+            sys.exit(1)
+        print('Nenhuma regressão em relação ao baseline')
+
+
+if __name__ == '__main__':
+    main()
@@ -28,6 +28,10 @@ setuptools.setup(
         "cryptography==42.0.8",
         "numpy==1.23.4"
     ],
+    extras_require={
+        # Leitura e gravação de parquet (write_partitioned_dataset, read_partitioned_dataset, índice de hashes)
+        "parquet": ["pyarrow>=8.0.0"]
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
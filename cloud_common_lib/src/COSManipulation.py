@@ -4,10 +4,16 @@ import os
 from operator import attrgetter
 from pathlib import Path
 
-import ibm_boto3
-import pandas as pd
-from ibm_botocore.config import Config
-from ibm_botocore.exceptions import ClientError
+try:
+    from .Utils import Utils
+except ImportError:
+    from Utils import Utils
+
+# Dependências carregadas apenas no primeiro uso (ver Utils.lazy_import)
+ibm_boto3 = Utils.lazy_import('ibm_boto3')
+ibm_botocore_config = Utils.lazy_import('ibm_botocore.config')
+ibm_botocore_exceptions = Utils.lazy_import('ibm_botocore.exceptions')
+pd = Utils.lazy_import('pandas')
 
 CLIENT_ERROR_ = "CLIENT ERROR: {0}\n"
 
@@ -25,7 +31,7 @@ class COSManipulation:
             ibm_api_key_id=cos_api_key_id,
             ibm_service_instance_id=cos_resource_crn,
             ibm_auth_endpoint=cos_auth_endpoint,
-            config=Config(signature_version='oauth'),
+            config=ibm_botocore_config.Config(signature_version='oauth'),
             endpoint_url=cos_endpoint
         )
 
@@ -34,7 +40,7 @@ class COSManipulation:
             ibm_api_key_id=cos_api_key_id,
             ibm_service_instance_id=cos_resource_crn,
             ibm_auth_endpoint=cos_auth_endpoint,
-            config=Config(signature_version='oauth'),
+            config=ibm_botocore_config.Config(signature_version='oauth'),
             endpoint_url=cos_endpoint
         )
 
@@ -56,7 +62,7 @@ class COSManipulation:
                 buckets_list.append(bucket.name)
                 logging.info("Nome do bucket: {0}".format(bucket.name))
             return buckets_list
-        except ClientError as be:
+        except ibm_botocore_exceptions.ClientError as be:
             logging.error(CLIENT_ERROR_.format(be))
         except Exception as e:
             logging.error("Não foi possível retornar a lista de buckets: {0}".format(e))
@@ -80,7 +86,7 @@ class COSManipulation:
                 files = self._cos.Bucket(os.environ.get('cos_bucket_name')).objects.filter(Delimiter='/', Prefix=folder)
             files_list = [file.key for file in files]
             return files_list
-        except ClientError as be:
+        except ibm_botocore_exceptions.ClientError as be:
             logging.error(CLIENT_ERROR_.format(be))
             logging.error("Não foi possível retornar o conteúdo do bucket: {0}".format(be))
         except Exception as e:
@@ -103,7 +109,7 @@ class COSManipulation:
             self._cos.Object(os.environ.get('cos_bucket_name'), remote_path + file_name).put(Body=file_content)
             logging.info("Item: {0} criado!".format(file_name))
             return True
-        except ClientError as be:
+        except ibm_botocore_exceptions.ClientError as be:
             logging.error(CLIENT_ERROR_.format(be))
             return False
         except Exception as e:
@@ -125,7 +131,7 @@ class COSManipulation:
             self._cos.Object(os.environ.get('cos_bucket_name'), file_name).delete()
             logging.info("Item: {0} apagado com sucesso!".format(file_name))
             return True
-        except ClientError as be:
+        except ibm_botocore_exceptions.ClientError as be:
             logging.error(CLIENT_ERROR_.format(be))
             return False
         except Exception as e:
@@ -168,7 +174,7 @@ class COSManipulation:
             content = file_cos["Body"].read()
             logging.info(content)
             return content
-        except ClientError as be:
+        except ibm_botocore_exceptions.ClientError as be:
             logging.error(CLIENT_ERROR_.format(be))
         except Exception as e:
             logging.error("Não foi possível retornar o conteúdo do item solicitado: {0}".format(e))
@@ -191,11 +197,30 @@ class COSManipulation:
             df = pd.read_csv(file_data)
             logging.info("Dataframe criado")
             return df
-        except ClientError as be:
+        except ibm_botocore_exceptions.ClientError as be:
             logging.error(CLIENT_ERROR_.format(be))
         except Exception as e:
             logging.error("Não foi possível retornar o conteúdo do item solicitado: {0}".format(e))
 
+    def open_file_stream_cos(self, filename: str = ""):
+        """
+        Função para abrir um arquivo do COS como stream, sem carregar o conteúdo inteiro em memória.
+
+        Parâmetros:
+            filename (str): Nome do arquivo. Caso o arquivo esteja dentro de uma estrutura de pasta, informar o caminho completo.
+
+        Retorno:
+            StreamingBody: Objeto file-like (read) que pode ser passado ao pd.read_csv, por exemplo em
+            PandasDFManipulation.sample_file ou PandasDFManipulation.profile_csv.
+        """
+        logging.info("Abrindo stream do arquivo {0}".format(filename))
+        try:
+            return self._cos.Object(os.environ.get('cos_bucket_name'), filename).get()["Body"]
+        except ibm_botocore_exceptions.ClientError as be:
+            logging.error(CLIENT_ERROR_.format(be))
+        except Exception as e:
+            logging.error("Não foi possível abrir o stream do item solicitado: {0}".format(e))
+
     def download_file_cos(self, file_name=''):
         """
         Função para baixar o arquivo do COS.
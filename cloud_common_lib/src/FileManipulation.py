@@ -1,40 +1,250 @@
+from __future__ import annotations
+
 import base64
+import glob
+import json
+import numbers
 import logging
-import pandas as pd
 import os
 import shutil
 import re
+import tempfile
+import time
 import unicodedata as ud
-from datetime import datetime
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives import padding
-from cryptography.hazmat.backends import default_backend
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import date, datetime
+from itertools import repeat
+from urllib.parse import quote, unquote
+
+try:
+    from .Utils import Utils
+except ImportError:
+    from Utils import Utils
+
+# Dependências carregadas apenas no primeiro uso (ver Utils.lazy_import)
+np = Utils.lazy_import('numpy')
+pd = Utils.lazy_import('pandas')
+ciphers = Utils.lazy_import('cryptography.hazmat.primitives.ciphers')
+crypto_padding = Utils.lazy_import('cryptography.hazmat.primitives.padding')
+crypto_backends = Utils.lazy_import('cryptography.hazmat.backends')
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# ioctl do Linux para clonar um arquivo por referência (reflink)
+_FICLONE = 0x40049409
+
+# Nome do diretório utilizado pelo Hive para partições com valor nulo
+_HIVE_NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+_PARTITION_OPERATORS = {
+    '=': lambda value, target: value == target,
+    '==': lambda value, target: value == target,
+    '!=': lambda value, target: value != target,
+    '<': lambda value, target: value is not None and value < target,
+    '<=': lambda value, target: value is not None and value <= target,
+    '>': lambda value, target: value is not None and value > target,
+    '>=': lambda value, target: value is not None and value >= target,
+    'in': lambda value, target: value in target,
+    'not in': lambda value, target: value not in target,
+}
+
+
+def _cast_partition_value(value: str, target):
+    # Converte o valor do diretório (texto) para o tipo do valor do filtro, para que ex: 10 > 9 e não '10' < '9'
+    if isinstance(target, str):
+        return value
+    if isinstance(target, bool):
+        if value.lower() not in ('true', 'false'):
+            raise ValueError(value)
+        return value.lower() == 'true'
+    if isinstance(target, numbers.Integral):
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+    if isinstance(target, numbers.Real):
+        return float(value)
+    if isinstance(target, pd.Timestamp):
+        return pd.Timestamp(value)
+    if isinstance(target, datetime):
+        return datetime.fromisoformat(value)
+    if isinstance(target, date):
+        return date.fromisoformat(value)
+    return type(target)(value)
+
+
+def _match_partition(operator: str, value, target) -> bool:
+    # Valores que não podem ser convertidos para o tipo do filtro não correspondem a ele
+    sample = next(iter(target), None) if operator in ('in', 'not in') else target
+    if value is not None and sample is not None:
+        try:
+            value = _cast_partition_value(value, sample)
+        except (TypeError, ValueError):
+            return operator in ('!=', 'not in')
+    try:
+        return _PARTITION_OPERATORS[operator](value, target)
+    except TypeError:
+        return operator in ('!=', 'not in')
+
+
+def _encrypt_values(key_encoded: str, values: list) -> list:
+    # O modo ECB não encadeia blocos, então um único contexto de cifra atende todos os valores, gerando a mesma
+    # saída do encrypt_data. O padding PKCS7 é aplicado manualmente para evitar criar um padder por valor.
+    key = base64.b64decode(key_encoded)
+    encryptor = ciphers.Cipher(ciphers.algorithms.AES(key), ciphers.modes.ECB(),
+                               backend=crypto_backends.default_backend()).encryptor()
+    encrypted = []
+    for value in values:
+        data = value.encode()
+        pad = 16 - len(data) % 16
+        ciphertext = encryptor.update(data + bytes([pad]) * pad)
+        encrypted.append(base64.b64encode(ciphertext).decode('utf-8'))
+    return encrypted
+
+
+def _decrypt_values(key_encoded: str, values: list) -> list:
+    key = base64.b64decode(key_encoded)
+    decryptor = ciphers.Cipher(ciphers.algorithms.AES(key), ciphers.modes.ECB(),
+                               backend=crypto_backends.default_backend()).decryptor()
+    decrypted = []
+    for value in values:
+        data = decryptor.update(base64.b64decode(value))
+        pad = data[-1] if data else 0
+        if not 1 <= pad <= 16 or data[-pad:] != bytes([pad]) * pad:
+            raise ValueError("Padding inválido ao descriptografar o valor: {0}".format(value))
+        decrypted.append(data[:-pad].decode())
+    return decrypted
+
+
+def _run_file_operations(path: str, operations: list) -> dict:
+    # Executado nos processos do run_batch: aplica as operações em sequência e mede o tempo de cada uma.
+    result = {'file': path, 'status': 'ok', 'error': None, 'timings': {}, 'rows': None}
+    start_file = time.perf_counter()
+    try:
+        for operation, kwargs in operations:
+            start = time.perf_counter()
+            if callable(operation):
+                name, returned = operation.__name__, operation(path, **kwargs)
+            elif operation == 'move_file_between_layers':
+                name = operation
+                file_name = os.path.relpath(path, os.path.join('files', kwargs['layer_origin']))
+                returned = FileManipulation.move_file_between_layers(file_name, **kwargs)
+            else:
+                name, returned = operation, getattr(FileManipulation, operation)(path, **kwargs)
+            result['timings'][name] = time.perf_counter() - start
+            if isinstance(returned, pd.DataFrame):
+                result['rows'] = len(returned)
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = repr(e)
+    result['seconds'] = time.perf_counter() - start_file
+    return result
 
 
 class FileManipulation:
     @staticmethod
-    def create_work_dir(folder: str):
+    def create_work_dir(folder: str, incremental: bool = False, retention_days: float = None,
+                        manifest: list = None) -> dict:
         """
         Função para criar localmente os diretórios de espelho do lake.
 
         Parâmetros:
             folder (str): Pasta a ser criada dentro das camadas do espelho do lake.
+            incremental (bool): Se False (default), os diretórios existentes são apagados e recriados.
+                                Se True, o conteúdo existente é mantido e apenas os diretórios inexistentes são criados.
+            retention_days (float): No modo incremental, apaga os arquivos modificados há mais dias que o informado.
+            manifest (list): No modo incremental, lista de chaves do COS (ex: retorno do get_bucket_contents_cos,
+                             como 'raw/pasta/arquivo.csv'). Os arquivos locais que não estão na lista são apagados.
 
         Retorno:
-            None
+            dict: Espaço em disco (bytes) utilizado por cada diretório criado.
         """
-        dirs = [
+        dirs = FileManipulation.work_dirs(folder)
+        for directory in dirs:
+            if incremental:
+                os.makedirs(directory, exist_ok=True)
+                FileManipulation.prune_work_dir(directory, retention_days, manifest)
+            else:
+                if os.path.exists(directory):
+                    shutil.rmtree(directory)
+                os.makedirs(directory)
+            logging.info("Diretório {0} criado com sucesso!".format(directory))
+        return FileManipulation.disk_usage_work_dir(folder)
+
+    @staticmethod
+    def work_dirs(folder: str) -> list:
+        """
+        Função para retornar os diretórios de espelho do lake de uma pasta.
+
+        Parâmetros:
+            folder (str): Pasta dentro das camadas do espelho do lake.
+
+        Retorno:
+            list: Diretórios da pasta em cada camada.
+        """
+        return [
             f'files/raw/{folder}', f'files/trusted/{folder}', f'files/refined/{folder}',
             f'files/exploratory/{folder}', f'files/features/{folder}', f'files/sandbox/{folder}'
         ]
-        for directory in dirs:
-            if os.path.exists(directory):
-                shutil.rmtree(directory)
-            os.makedirs(directory)
-            logging.info("Diretório {0} criado com sucesso!".format(directory))
 
     @staticmethod
-    def move_file_between_layers(file_name: str, layer_origin: str, layer_destiny: str):
+    def prune_work_dir(directory: str, retention_days: float = None, manifest: list = None) -> int:
+        """
+        Função para apagar de um diretório do espelho do lake os arquivos antigos ou que não existem mais no COS.
+
+        Parâmetros:
+            directory (str): Diretório que será verificado (ex: files/raw/pasta).
+            retention_days (float): Apaga os arquivos modificados há mais dias que o informado.
+            manifest (list): Lista de chaves do COS. Os arquivos cujo caminho relativo à pasta files não está na
+                             lista são apagados. O diretório só é verificado se ao menos uma chave da lista
+                             pertencer a ele, evitando apagar camadas que não foram listadas.
+
+        Retorno:
+            int: Quantidade de arquivos apagados.
+        """
+        if retention_days is None and manifest is None:
+            return 0
+        limit = time.time() - retention_days * 86400 if retention_days is not None else None
+        keys = set(manifest) if manifest is not None else None
+        prefix = os.path.relpath(directory, 'files').replace(os.sep, '/') + '/'
+        if keys is not None and not any(key.startswith(prefix) for key in keys):
+            keys = None
+        removed = 0
+        for root, _, files in os.walk(directory):
+            for file in files:
+                path = os.path.join(root, file)
+                key = os.path.relpath(path, 'files').replace(os.sep, '/')
+                if (limit is not None and os.path.getmtime(path) < limit) or (keys is not None and key not in keys):
+                    os.remove(path)
+                    removed += 1
+        logging.info("Foram apagados {0} arquivos do diretório {1}".format(removed, directory))
+        return removed
+
+    @staticmethod
+    def disk_usage_work_dir(folder: str) -> dict:
+        """
+        Função para retornar o espaço em disco utilizado pela pasta em cada camada do espelho do lake.
+
+        Parâmetros:
+            folder (str): Pasta dentro das camadas do espelho do lake.
+
+        Retorno:
+            dict: Espaço em disco (bytes) utilizado por cada diretório.
+        """
+        usage = {}
+        for directory in FileManipulation.work_dirs(folder):
+            usage[directory] = 0
+            for root, _, files in os.walk(directory):
+                usage[directory] += sum(os.path.getsize(os.path.join(root, file)) for file in files)
+            logging.info("Diretório {0} utiliza {1} bytes".format(directory, usage[directory]))
+        return usage
+
+    @staticmethod
+    def move_file_between_layers(file_name: str, layer_origin: str, layer_destiny: str, mode: str = 'copy'):
         """
         Função para movimentar um arquivo entre duas camadas.
 
@@ -42,6 +252,15 @@ class FileManipulation:
             file_name (str): Nome do arquivo que será movimentado.
             layer_origin (str): Camada de origem do arquivo.
             layer_destiny (str): Camada de destino do arquivo.
+            mode (str): Forma de cópia do arquivo:
+                        'copy' (default): cópia completa com shutil.copy2.
+                        'auto': tenta reflink (cópia por referência, em sistemas de arquivos como Btrfs e XFS),
+                                depois copy_file_range (cópia dentro do kernel) e por fim a cópia completa.
+                        'reflink': tenta reflink e, se não for suportado, utiliza a cópia completa.
+                        'hardlink': cria um hard link (sem cópia de dados) e, se não for possível, utiliza a cópia
+                                    completa. As duas camadas passam a compartilhar o mesmo arquivo, portanto o
+                                    arquivo não deve ser alterado no próprio local (ex: normalize_file e trim_file);
+                                    utilize funções que substituem o arquivo, como o clean_file.
 
         Retorno:
             str: Caminho do arquivo na camada de destino.
@@ -49,12 +268,78 @@ class FileManipulation:
         file_name_origin = f'files/{layer_origin}/{file_name}'
         file_destiny = f'files/{layer_destiny}/{file_name}'.replace('.txt', '.csv')
         if os.path.exists(file_name_origin):
-            shutil.copy2(src=file_name_origin, dst=file_destiny)
+            mode_used = FileManipulation.promote_file(src=file_name_origin, dst=file_destiny, mode=mode)
         else:
             raise Exception("Arquivo inexistente: " + file_name_origin)
-        logging.info("Os arquivos foram copiados entre as camadas!")
+        logging.info("Os arquivos foram copiados entre as camadas (modo: {0})!".format(mode_used))
         return file_destiny
 
+    @staticmethod
+    def move_files_between_layers(file_names: list, layer_origin: str, layer_destiny: str, mode: str = 'auto'):
+        """
+        Função para movimentar vários arquivos entre duas camadas em uma única chamada.
+
+        Parâmetros:
+            file_names (list): Nomes dos arquivos que serão movimentados.
+            layer_origin (str): Camada de origem dos arquivos.
+            layer_destiny (str): Camada de destino dos arquivos.
+            mode (str): Forma de cópia dos arquivos, conforme o move_file_between_layers (default 'auto').
+
+        Retorno:
+            list: Caminhos dos arquivos na camada de destino.
+        """
+        return [FileManipulation.move_file_between_layers(file_name, layer_origin, layer_destiny, mode)
+                for file_name in file_names]
+
+    @staticmethod
+    def promote_file(src: str, dst: str, mode: str = 'auto') -> str:
+        """
+        Função para copiar um arquivo evitando, quando possível, a leitura e escrita completa dos dados.
+
+        Parâmetros:
+            src (str): Caminho do arquivo de origem.
+            dst (str): Caminho do arquivo de destino (substituído caso já exista).
+            mode (str): 'auto', 'reflink', 'hardlink' ou 'copy', conforme o move_file_between_layers.
+
+        Retorno:
+            str: Forma de cópia efetivamente utilizada ('reflink', 'copy_file_range', 'hardlink' ou 'copy').
+        """
+        modes = ['auto', 'reflink', 'hardlink', 'copy']
+        if mode not in modes:
+            raise Exception('Os modos permitidos são: {0}'.format(modes))
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            if mode == 'hardlink':
+                return 'hardlink'
+            # O destino é um hard link da origem: gravar nele alteraria também o arquivo de origem
+            os.remove(dst)
+        if mode == 'hardlink':
+            try:
+                if os.path.exists(dst):
+                    os.remove(dst)
+                os.link(src, dst)
+                return 'hardlink'
+            except OSError as e:
+                logging.info("Não foi possível criar o hard link para {0}: {1}".format(dst, e))
+        if mode in ('auto', 'reflink') and fcntl is not None:
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                shutil.copystat(src, dst)
+                return 'reflink'
+            except OSError:
+                pass
+        if mode == 'auto' and hasattr(os, 'copy_file_range'):
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 64 * 1024 * 1024):
+                        pass
+                shutil.copystat(src, dst)
+                return 'copy_file_range'
+            except OSError:
+                pass
+        shutil.copy2(src=src, dst=dst)
+        return 'copy'
+
     @staticmethod
     def encrypt_data(key_encoded: str, data: str) -> str:
         """
@@ -68,14 +353,97 @@ class FileManipulation:
             str: Valor criptografado.
         """
         key = base64.b64decode(key_encoded)
-        backend = default_backend()
-        cipher = Cipher(algorithms.AES(key), modes.ECB(), backend=backend)
+        backend = crypto_backends.default_backend()
+        cipher = ciphers.Cipher(ciphers.algorithms.AES(key), ciphers.modes.ECB(), backend=backend)
         encryptor = cipher.encryptor()
-        padder = padding.PKCS7(128).padder()
+        padder = crypto_padding.PKCS7(128).padder()
         padded_data = padder.update(data.encode()) + padder.finalize()
         ciphertext = encryptor.update(padded_data) + encryptor.finalize()
         ciphertext = base64.b64encode(ciphertext).decode('utf-8')
         return ciphertext
+
+    @staticmethod
+    def decrypt_data(key_encoded: str, data: str) -> str:
+        """
+        Função para descriptografar uma string criptografada pelo encrypt_data.
+
+        Parâmetros:
+            key_encoded (str): Chave utilizada na criptografia.
+            data (str): Valor criptografado.
+
+        Retorno:
+            str: Valor original.
+        """
+        key = base64.b64decode(key_encoded)
+        backend = crypto_backends.default_backend()
+        cipher = ciphers.Cipher(ciphers.algorithms.AES(key), ciphers.modes.ECB(), backend=backend)
+        decryptor = cipher.decryptor()
+        unpadder = crypto_padding.PKCS7(128).unpadder()
+        padded_data = decryptor.update(base64.b64decode(data)) + decryptor.finalize()
+        plaintext = unpadder.update(padded_data) + unpadder.finalize()
+        return plaintext.decode()
+
+    @staticmethod
+    def encrypt_column(df: pd.DataFrame, column: str, key_encoded: str, new_column: str = None,
+                       processes: int = None, chunk_size: int = 100000) -> pd.DataFrame:
+        """
+        Função para criptografar uma coluna inteira de um DataFrame, gerando o mesmo resultado do encrypt_data
+        para cada valor. Cada valor distinto é criptografado uma única vez, reaproveitando o mesmo contexto de
+        cifra, e os valores nulos são mantidos nulos.
+
+        Parâmetros:
+            df (pd.DataFrame): DataFrame com a coluna que será criptografada.
+            column (str): Nome da coluna que será criptografada. Valores que não são string são convertidos com str().
+            key_encoded (str): Chave utilizada na criptografia.
+            new_column (str): Nome da coluna que receberá os valores criptografados. Por padrão a própria coluna.
+            processes (int): Quantidade de processos utilizados quando houver mais de chunk_size valores distintos.
+                             Se não for informado, a criptografia é executada no processo atual.
+            chunk_size (int): Quantidade de valores distintos enviados para cada processo.
+
+        Retorno:
+            pd.DataFrame: Dataframe com a coluna criptografada.
+        """
+        logging.info("Criptografando a coluna {0}".format(column))
+        df[new_column or column] = FileManipulation._apply_cipher(df[column], _encrypt_values, key_encoded,
+                                                                  processes, chunk_size)
+        return df
+
+    @staticmethod
+    def decrypt_column(df: pd.DataFrame, column: str, key_encoded: str, new_column: str = None,
+                       processes: int = None, chunk_size: int = 100000) -> pd.DataFrame:
+        """
+        Função para descriptografar uma coluna criptografada pelo encrypt_column ou pelo encrypt_data.
+
+        Parâmetros:
+            df (pd.DataFrame): DataFrame com a coluna que será descriptografada.
+            column (str): Nome da coluna criptografada.
+            key_encoded (str): Chave utilizada na criptografia.
+            new_column (str): Nome da coluna que receberá os valores originais. Por padrão a própria coluna.
+            processes (int): Quantidade de processos utilizados quando houver mais de chunk_size valores distintos.
+                             Se não for informado, a descriptografia é executada no processo atual.
+            chunk_size (int): Quantidade de valores distintos enviados para cada processo.
+
+        Retorno:
+            pd.DataFrame: Dataframe com a coluna descriptografada.
+        """
+        logging.info("Descriptografando a coluna {0}".format(column))
+        df[new_column or column] = FileManipulation._apply_cipher(df[column], _decrypt_values, key_encoded,
+                                                                  processes, chunk_size)
+        return df
+
+    @staticmethod
+    def _apply_cipher(series: pd.Series, function, key_encoded: str, processes: int, chunk_size: int) -> np.ndarray:
+        codes, uniques = pd.factorize(series)
+        uniques = [str(value) for value in uniques]
+        chunks = [uniques[i:i + chunk_size] for i in range(0, len(uniques), chunk_size)]
+        if processes and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                results = list(executor.map(function, repeat(key_encoded), chunks))
+        else:
+            results = [function(key_encoded, chunk) for chunk in chunks]
+        values = np.array([value for result in results for value in result] + [None], dtype=object)
+        # Nulos recebem o código -1 no factorize, que aponta para o None adicionado no final do array
+        return values[codes]
     
     @staticmethod
     def filter_rows_using_values(df: pd.DataFrame, column_name: str, value_filter: str) -> pd.DataFrame:
@@ -228,4 +596,302 @@ class FileManipulation:
             text = re.sub(pattern=r'\s{2,}', repl=' ', string=f.read())
         with open(file=file, mode="w", encoding='utf-8') as f:
             f.write(text)
-    
\ No newline at end of file
+
+    @staticmethod
+    def clean_file(file_name: str, normalize: bool = True, trim: bool = True, encoding: str = 'utf-8',
+                   block_size: int = 1024 * 1024):
+        """
+        Função para normalizar os caracteres e/ou remover agrupamentos de espaços de um arquivo lendo blocos de
+        tamanho fixo, sem carregar o arquivo inteiro em memória. O resultado é gravado em um arquivo temporário no
+        mesmo diretório, que substitui o original de forma atômica ao final, portanto uma falha durante o
+        processamento não corrompe o arquivo. Quando as duas transformações são solicitadas, elas são executadas
+        em uma única leitura, primeiro a normalização e depois a remoção de espaços.
+
+        Parâmetros:
+            file_name (str): Caminho do arquivo que será tratado.
+            normalize (bool): Indica se os caracteres devem ser normalizados, como no normalize_file (default True).
+            trim (bool): Indica se os agrupamentos de espaços devem ser removidos, como no trim_file (default True).
+            encoding (str): Codificação utilizada para ler e gravar o arquivo. Padrão é 'utf-8'.
+            block_size (int): Quantidade de caracteres lidos por bloco. Padrão é 1048576.
+
+        Retorno:
+            None
+        """
+        logging.info("Tratando o arquivo {0} (normalização: {1}, remoção de espaços: {2})"
+                     .format(file_name, normalize, trim))
+        normalize_carry = ''
+        trim_carry = ''
+        directory = os.path.dirname(os.path.abspath(file_name))
+        temp_file = tempfile.NamedTemporaryFile(mode="w", encoding=encoding, dir=directory, delete=False)
+        try:
+            with open(file=file_name, mode="r", encoding=encoding) as f, temp_file:
+                while True:
+                    block = f.read(block_size)
+                    text = normalize_carry + block
+                    if normalize:
+                        normalize_carry = ''
+                        if block:
+                            # Mantém o último caractere base e os combinantes que o seguem para o próximo bloco
+                            cut = len(text)
+                            while cut > 0 and ud.combining(text[cut - 1]):
+                                cut -= 1
+                            cut = max(cut - 1, 0)
+                            text, normalize_carry = text[:cut], text[cut:]
+                        text = ud.normalize('NFD', text).encode('ascii', 'ignore').decode("utf-8")
+                    if trim:
+                        text = trim_carry + text
+                        trim_carry = ''
+                        if block:
+                            # Um agrupamento de espaços no fim do bloco pode continuar no próximo bloco
+                            match = re.search(r'\s+\Z', text)
+                            if match:
+                                text, trim_carry = text[:match.start()], text[match.start():]
+                                if len(trim_carry) > 2:
+                                    trim_carry = '  '
+                        text = re.sub(pattern=r'\s{2,}', repl=' ', string=text)
+                    temp_file.write(text)
+                    if not block:
+                        break
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            shutil.copymode(file_name, temp_file.name)
+            os.replace(temp_file.name, file_name)
+        except BaseException:
+            if os.path.exists(temp_file.name):
+                os.remove(temp_file.name)
+            raise
+        logging.info("Arquivo {0} tratado com sucesso!".format(file_name))
+
+    @staticmethod
+    def normalize_file_stream(file_name: str, encoding: str = 'utf-8', block_size: int = 1024 * 1024):
+        """
+        Função para normalizar os caracteres de um arquivo em blocos, com o mesmo resultado do normalize_file e
+        substituição atômica do arquivo.
+
+        Parâmetros:
+            file_name (str): Caminho do arquivo onde será realizada a normalização dos caracteres.
+            encoding (str): Codificação utilizada para ler o arquivo. Padrão é 'utf-8'.
+            block_size (int): Quantidade de caracteres lidos por bloco. Padrão é 1048576.
+
+        Retorno:
+            None
+        """
+        FileManipulation.clean_file(file_name, normalize=True, trim=False, encoding=encoding, block_size=block_size)
+
+    @staticmethod
+    def trim_file_stream(file: str, block_size: int = 1024 * 1024):
+        """
+        Função para remover agrupamentos de espaços de um arquivo em blocos, com o mesmo resultado do trim_file e
+        substituição atômica do arquivo.
+
+        Parâmetros:
+            file (str): Caminho do arquivo onde será realizada a remoção de agrupamentos de espaços.
+            block_size (int): Quantidade de caracteres lidos por bloco. Padrão é 1048576.
+
+        Retorno:
+            None
+        """
+        FileManipulation.clean_file(file, normalize=False, trim=True, encoding='utf-8', block_size=block_size)
+
+    @staticmethod
+    def run_batch(directory: str, operations: list, pattern: str = '*', max_workers: int = None,
+                  manifest_file: str = None) -> pd.DataFrame:
+        """
+        Função para aplicar uma lista de operações em todos os arquivos de um diretório (ex: files/raw/pasta),
+        em paralelo por um pool de processos com concorrência limitada. Cada arquivo concluído é registrado em um
+        manifesto, de forma que uma execução interrompida, quando reiniciada com as mesmas operações, processa
+        apenas os arquivos que ainda não foram concluídos com sucesso.
+
+        Parâmetros:
+            directory (str): Diretório com os arquivos que serão processados.
+            operations (list): Operações executadas em sequência para cada arquivo. Cada item pode ser o nome de
+                               uma função do FileManipulation que recebe o caminho do arquivo como primeiro
+                               parâmetro (ex: 'normalize_file', 'trim_file', 'clean_file',
+                               'create_dataframe_from_file'), uma função definida no nível do módulo com a mesma
+                               assinatura, ou uma tupla (operação, dict de parâmetros adicionais).
+                               Para 'move_file_between_layers' informe os parâmetros layer_origin e
+                               layer_destiny, o nome do arquivo é calculado a partir de files/<layer_origin>.
+            pattern (str): Padrão utilizado para selecionar os arquivos do diretório. Padrão é "*".
+            max_workers (int): Quantidade máxima de processos. Por padrão a quantidade de CPUs.
+            manifest_file (str): Caminho do manifesto (JSON lines). Padrão é um arquivo por diretório em
+                                 files/.batch_manifests, fora das camadas (não é apagado pelo prune_work_dir).
+
+        Retorno:
+            pd.DataFrame: Relatório com o status, o tempo total, o tempo de cada operação e a quantidade de linhas
+                          (quando a operação retorna um DataFrame) de cada arquivo processado nesta execução.
+        """
+        operations = [operation if isinstance(operation, tuple) else (operation, {}) for operation in operations]
+        fingerprint = json.dumps([[getattr(op, '__name__', op), kwargs] for op, kwargs in operations],
+                                 sort_keys=True, default=str)
+        manifest_file = manifest_file or os.path.join(
+            'files', '.batch_manifests', re.sub(r'[^\w.-]', '_', os.path.normpath(directory)) + '.jsonl')
+        os.makedirs(os.path.dirname(manifest_file) or '.', exist_ok=True)
+
+        completed = set()
+        torn_line = False
+        if os.path.exists(manifest_file):
+            with open(manifest_file, 'r', encoding='utf-8') as manifest:
+                for line in manifest:
+                    torn_line = not line.endswith('\n')
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Linha incompleta de uma execução interrompida durante a escrita
+                        logging.warning("Linha inválida ignorada no manifesto {0}: {1!r}".format(manifest_file, line))
+                        continue
+                    if entry['status'] == 'ok' and entry['operations'] == fingerprint:
+                        completed.add(entry['file'])
+        files = [file for file in sorted(glob.glob(os.path.join(directory, pattern)))
+                 if os.path.isfile(file) and file not in completed
+                 and os.path.abspath(file) != os.path.abspath(manifest_file)]
+        logging.info("Processando {0} arquivos do diretório {1} ({2} já concluídos)"
+                     .format(len(files), directory, len(completed)))
+
+        max_workers = max_workers or os.cpu_count() or 1
+        report = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor, \
+                open(manifest_file, 'a', encoding='utf-8') as manifest:
+            if torn_line:
+                manifest.write('\n')
+            pending = set()
+            remaining = iter(files)
+            while True:
+                for file in remaining:
+                    pending.add(executor.submit(_run_file_operations, file, operations))
+                    if len(pending) >= max_workers * 2:
+                        break
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    result['operations'] = fingerprint
+                    manifest.write(json.dumps(result) + '\n')
+                    manifest.flush()
+                    report.append(result)
+                    if result['status'] == 'ok':
+                        logging.info("Arquivo {0} processado em {1:.3f}s".format(result['file'], result['seconds']))
+                    else:
+                        logging.error("Erro ao processar o arquivo {0}: {1}".format(result['file'], result['error']))
+
+        df_report = pd.DataFrame(report, columns=['file', 'status', 'seconds', 'rows', 'error'])
+        timings = pd.DataFrame([result['timings'] for result in report], index=df_report.index)
+        return pd.concat([df_report, timings], axis=1)
+
+    @staticmethod
+    def write_partitioned_dataset(df: pd.DataFrame, layer: str, folder: str, partition_columns: list,
+                                  max_workers: int = None) -> list:
+        """
+        Função para gravar um DataFrame em arquivos parquet particionados no formato Hive, ex:
+        files/<layer>/<folder>/dataIngestao=2024-01-01/part-00000-<execução>.parquet.
+        Cada partição é gravada em paralelo e os nomes dos arquivos são únicos por execução, portanto novas
+        gravações são adicionadas às partições existentes sem sobrescrever os arquivos anteriores.
+
+        Parâmetros:
+            df (pd.DataFrame): DataFrame que será gravado.
+            layer (str): Camada onde os dados serão gravados (ex: raw, trusted, refined).
+            folder (str): Pasta dentro da camada.
+            partition_columns (list): Colunas utilizadas no particionamento, na ordem dos diretórios. Para
+                                      particionar por dia a partir do add_partition_column, crie antes uma coluna
+                                      com a data, ex: df['dia'] = df['dataIngestao'].str[:10].
+            max_workers (int): Quantidade máxima de partições gravadas simultaneamente.
+
+        Retorno:
+            list: Caminhos dos arquivos gravados.
+        """
+        Utils.require_module('pyarrow', 'parquet')
+        base_dir = f'files/{layer}/{folder}'
+        run_id = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        groups = list(df.groupby(partition_columns, dropna=False, sort=False, observed=True))
+
+        def write_partition(position):
+            key, group = groups[position]
+            key = key if isinstance(key, tuple) else (key,)
+            parts = [f'{column}={_HIVE_NULL_PARTITION if pd.isna(value) else quote(str(value), safe="")}'
+                     for column, value in zip(partition_columns, key)]
+            directory = os.path.join(base_dir, *parts)
+            os.makedirs(directory, exist_ok=True)
+            file_name = os.path.join(directory, f'part-{position:05d}-{run_id}.parquet')
+            temp_file = os.path.join(directory, f'.part-{position:05d}-{run_id}.parquet.tmp')
+            group.drop(columns=partition_columns).to_parquet(temp_file, index=False)
+            os.replace(temp_file, file_name)
+            return file_name
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            files = list(executor.map(write_partition, range(len(groups))))
+        logging.info("Foram gravadas {0} partições em {1}".format(len(files), base_dir))
+        return files
+
+    @staticmethod
+    def read_partitioned_dataset(layer: str, folder: str, filters=None, columns: list = None,
+                                 max_workers: int = None) -> pd.DataFrame:
+        """
+        Função para ler um conjunto de dados gravado pelo write_partitioned_dataset, lendo apenas as partições que
+        atendem aos filtros informados. Os diretórios que não atendem aos filtros não são percorridos.
+
+        Parâmetros:
+            layer (str): Camada onde os dados estão gravados.
+            folder (str): Pasta dentro da camada.
+            filters (list | callable): Lista de tuplas (coluna, operador, valor) aplicadas sobre as colunas de
+                                       partição, com os operadores '=', '!=', '<', '<=', '>', '>=', 'in' e
+                                       'not in'. Os valores das partições são convertidos para o tipo do valor
+                                       do filtro (str, int, float, bool, date, datetime) antes da comparação, ex:
+                                       [('dia', '>=', '2024-01-25'), ('mes', '<', 10)]; nos operadores 'in' e
+                                       'not in' é utilizado o tipo do primeiro valor da lista. None seleciona a
+                                       partição de valores nulos. Também pode ser uma função que recebe um
+                                       dicionário {coluna: valor} com as partições de cada arquivo e retorna bool.
+            columns (list): Colunas que serão lidas. Por padrão todas.
+            max_workers (int): Quantidade máxima de arquivos lidos simultaneamente.
+
+        Retorno:
+            pd.DataFrame: Dados das partições selecionadas, com as colunas de partição (texto) ao final.
+        """
+        Utils.require_module('pyarrow', 'parquet')
+        base_dir = f'files/{layer}/{folder}'
+        filters = filters or []
+        conditions = {}
+        if not callable(filters):
+            for column, operator, target in filters:
+                if operator not in _PARTITION_OPERATORS:
+                    raise Exception('Os operadores permitidos são: {0}'.format(list(_PARTITION_OPERATORS)))
+                target = list(target) if operator in ('in', 'not in') else target
+                conditions.setdefault(column, []).append((operator, target))
+
+        def parse(directory):
+            column, value = directory.split('=', 1)
+            return column, None if value == _HIVE_NULL_PARTITION else unquote(value)
+
+        selected = []
+        for root, dirs, files in os.walk(base_dir):
+            relative = os.path.relpath(root, base_dir)
+            partitions = dict(parse(part) for part in relative.split(os.sep) if '=' in part)
+            kept = []
+            for directory in sorted(dirs):
+                if '=' not in directory:
+                    continue
+                column, value = parse(directory)
+                if all(_match_partition(operator, value, target) for operator, target in conditions.get(column, [])):
+                    kept.append(directory)
+            dirs[:] = kept
+            files = [file for file in sorted(files) if file.endswith('.parquet') and not file.startswith('.')]
+            if files and callable(filters) and not filters(partitions):
+                continue
+            selected.extend((os.path.join(root, file), partitions) for file in files)
+
+        def read_file(item):
+            path, partitions = item
+            file_columns = [column for column in columns if column not in partitions] if columns else None
+            df = pd.read_parquet(path, columns=file_columns)
+            for column, value in partitions.items():
+                if not columns or column in columns:
+                    df[column] = value
+            return df
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(read_file, selected))
+        logging.info("Foram lidos {0} arquivos de {1}".format(len(frames), base_dir))
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,291 @@
+import atexit
+import functools
+import importlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+
+try:
+    from .Utils import Utils
+except ImportError:
+    from Utils import Utils
+
+pd = Utils.lazy_import('pandas')
+
+# Módulos instrumentados por padrão (o nome da classe é igual ao do módulo)
+DEFAULT_MODULES = ['COSManipulation', 'PostgresManipulation', 'MongoManipulation', 'FileManipulation',
+                   'PandasDFManipulation']
+
+# Limites (em segundos) dos buckets do histograma de latência
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+METRIC_PREFIX = 'cloud_common_lib'
+
+
+class Instrumentation:
+    """
+    Instrumentação opcional dos métodos públicos das classes de manipulação: quantidade de chamadas, histograma de
+    latência, linhas e bytes processados e erros (exceções propagadas) por método.
+
+    Enquanto enable não é chamado nenhuma classe é alterada, portanto não há custo algum. Ao habilitar, os métodos
+    públicos (inclusive staticmethods e classmethods) são substituídos por wrappers, e disable restaura os originais.
+    Os tempos são inclusivos: um método que chama outro método instrumentado contabiliza também o tempo da chamada
+    interna. Em métodos generator o tempo e as linhas são contabilizados ao longo de toda a iteração.
+
+    Linhas e bytes são inferidos do retorno (DataFrame, Series, list e tuple contam linhas; bytes e str contam bytes).
+    Quando o retorno não tem tamanho (por exemplo None ou bool), são contadas as linhas dos DataFrames recebidos.
+
+    Exemplo:
+        Instrumentation.enable(output_file='files/metrics.prom')
+        ... pipeline ...
+        # Ao final do processo o arquivo é gravado no formato textfile do Prometheus (.prom) ou JSON (demais extensões)
+    """
+
+    _lock = threading.Lock()
+    _metrics = {}
+    _originals = []
+    _buckets = DEFAULT_BUCKETS
+    _output_file = None
+    _atexit_registered = False
+
+    @staticmethod
+    def _resolve_classes(modules):
+        classes = []
+        package = __package__
+        for name in modules:
+            try:
+                module = importlib.import_module(f"{package}.{name}" if package else name)
+                classes.append(getattr(module, name))
+            except Exception as e:
+                logging.warning("Não foi possível instrumentar {0}: {1}".format(name, e))
+        return classes
+
+    @classmethod
+    def enable(cls, classes: list = None, output_file: str = None, buckets: tuple = None):
+        """
+        Função para habilitar a instrumentação.
+
+        Parâmetros:
+            classes (list): Classes instrumentadas. Padrão são as classes de DEFAULT_MODULES.
+            output_file (str): Arquivo gravado ao final do processo (.prom para o formato textfile do Prometheus,
+                               demais extensões em JSON). Padrão é a variável de ambiente instrumentation_output_file.
+            buckets (tuple): Limites, em segundos, dos buckets do histograma. Padrão é DEFAULT_BUCKETS.
+
+        Retorno:
+            None
+        """
+        if buckets is not None:
+            cls._buckets = tuple(sorted(buckets))
+        if classes is None:
+            classes = cls._resolve_classes(DEFAULT_MODULES)
+        instrumented = {klass for klass, _, _ in cls._originals}
+        for klass in classes:
+            if klass in instrumented:
+                continue
+            for name in list(vars(klass)):
+                if name.startswith('_'):
+                    continue
+                attribute = inspect.getattr_static(klass, name)
+                if isinstance(attribute, staticmethod):
+                    wrapped = staticmethod(cls._wrap(klass.__name__, name, attribute.__func__))
+                elif isinstance(attribute, classmethod):
+                    wrapped = classmethod(cls._wrap(klass.__name__, name, attribute.__func__))
+                elif inspect.isfunction(attribute):
+                    wrapped = cls._wrap(klass.__name__, name, attribute)
+                else:
+                    continue
+                cls._originals.append((klass, name, attribute))
+                setattr(klass, name, wrapped)
+            logging.info("Instrumentação habilitada para {0}".format(klass.__name__))
+
+        output_file = output_file or os.environ.get('instrumentation_output_file')
+        if output_file:
+            cls._output_file = output_file
+            if not cls._atexit_registered:
+                atexit.register(cls._export_at_exit)
+                cls._atexit_registered = True
+
+    @classmethod
+    def disable(cls):
+        """
+        Função para remover a instrumentação, restaurando os métodos originais. As métricas já coletadas são mantidas.
+        """
+        for klass, name, attribute in reversed(cls._originals):
+            setattr(klass, name, attribute)
+        cls._originals = []
+
+    @classmethod
+    def reset(cls):
+        """
+        Função para descartar as métricas coletadas.
+        """
+        with cls._lock:
+            cls._metrics = {}
+
+    @staticmethod
+    def _measure(value):
+        if isinstance(value, (pd.DataFrame, pd.Series, list, tuple)):
+            return len(value), 0
+        if isinstance(value, (bytes, bytearray)):
+            return 0, len(value)
+        if isinstance(value, str):
+            return 0, len(value.encode('utf-8', errors='ignore'))
+        return None
+
+    @classmethod
+    def _measure_call(cls, args, kwargs, result):
+        measured = cls._measure(result)
+        if measured is not None:
+            return measured
+        rows = sum(len(value) for value in list(args) + list(kwargs.values()) if isinstance(value, pd.DataFrame))
+        return rows, 0
+
+    @classmethod
+    def _record(cls, key, elapsed, rows, size, error):
+        with cls._lock:
+            metric = cls._metrics.get(key)
+            if metric is None:
+                metric = {'calls': 0, 'errors': 0, 'seconds': 0.0, 'rows': 0, 'bytes': 0,
+                          'buckets': [0] * (len(cls._buckets) + 1)}
+                cls._metrics[key] = metric
+            metric['calls'] += 1
+            metric['errors'] += int(error)
+            metric['seconds'] += elapsed
+            metric['rows'] += rows
+            metric['bytes'] += size
+            metric['buckets'][bisect_left(cls._buckets, elapsed)] += 1
+
+    @classmethod
+    def _wrap(cls, class_name, method_name, function):
+        key = (class_name, method_name)
+
+        if inspect.isgeneratorfunction(function):
+            @functools.wraps(function)
+            def generator_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                rows = size = 0
+                error = False
+                try:
+                    for item in function(*args, **kwargs):
+                        # Lotes podem vir acompanhados de metadados, ex: (batch, watermark); itens sem tamanho
+                        # contam como uma linha
+                        batch = item[0] if isinstance(item, tuple) and item else item
+                        measured = cls._measure(batch) if not isinstance(batch, str) else None
+                        if measured is None:
+                            measured = (1, 0)
+                        rows += measured[0]
+                        size += measured[1]
+                        yield item
+                except GeneratorExit:
+                    # Consumidor interrompeu a iteração, não é erro
+                    raise
+                except BaseException:
+                    error = True
+                    raise
+                finally:
+                    cls._record(key, time.perf_counter() - start, rows, size, error)
+            return generator_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                cls._record(key, time.perf_counter() - start, 0, 0, True)
+                raise
+            rows, size = cls._measure_call(args, kwargs, result)
+            cls._record(key, time.perf_counter() - start, rows, size, False)
+            return result
+        return wrapper
+
+    @classmethod
+    def snapshot(cls):
+        """
+        Função para retornar as métricas coletadas.
+
+        Retorno:
+            dict: {'Classe.metodo': {'calls', 'errors', 'seconds', 'rows', 'bytes', 'histogram'}}, com o histograma
+                  no formato {limite_em_segundos: quantidade de chamadas até o limite} (acumulado, com '+Inf')
+        """
+        with cls._lock:
+            metrics = {key: dict(metric, buckets=list(metric['buckets'])) for key, metric in cls._metrics.items()}
+        summary = {}
+        for (class_name, method_name), metric in sorted(metrics.items()):
+            cumulative = 0
+            histogram = {}
+            for bound, count in zip(list(cls._buckets) + ['+Inf'], metric.pop('buckets')):
+                cumulative += count
+                histogram[str(bound)] = cumulative
+            metric['seconds'] = round(metric['seconds'], 6)
+            metric['histogram'] = histogram
+            summary[f"{class_name}.{method_name}"] = metric
+        return summary
+
+    @classmethod
+    def to_prometheus(cls):
+        """
+        Função para retornar as métricas no formato texto do Prometheus (node_exporter textfile collector).
+
+        Retorno:
+            str: Métricas em formato Prometheus
+        """
+        counters = [('calls', 'calls_total', 'Chamadas por método'),
+                    ('errors', 'errors_total', 'Chamadas que lançaram exceção'),
+                    ('rows', 'rows_total', 'Linhas processadas'),
+                    ('bytes', 'bytes_total', 'Bytes processados')]
+        summary = cls.snapshot()
+        labels = {key: 'class="{0}",method="{1}"'.format(*key.split('.', 1)) for key in summary}
+        lines = []
+        for field, name, description in counters:
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {description}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} counter")
+            for key, metric in summary.items():
+                lines.append(f"{METRIC_PREFIX}_{name}{{{labels[key]}}} {metric[field]}")
+        name = f"{METRIC_PREFIX}_duration_seconds"
+        lines.append(f"# HELP {name} Latência por método")
+        lines.append(f"# TYPE {name} histogram")
+        for key, metric in summary.items():
+            for bound, count in metric['histogram'].items():
+                lines.append(f'{name}_bucket{{{labels[key]},le="{bound}"}} {count}')
+            lines.append(f"{name}_sum{{{labels[key]}}} {metric['seconds']}")
+            lines.append(f"{name}_count{{{labels[key]}}} {metric['calls']}")
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def export(cls, output_file: str):
+        """
+        Função para gravar as métricas de forma atômica (o coletor nunca lê um arquivo parcial).
+
+        Parâmetros:
+            output_file (str): Caminho do arquivo; .prom grava no formato do Prometheus, demais extensões em JSON.
+
+        Retorno:
+            None
+        """
+        if output_file.endswith('.prom'):
+            content = cls.to_prometheus()
+        else:
+            content = json.dumps(cls.snapshot(), indent=2)
+        directory = os.path.dirname(output_file) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        # mkstemp cria o arquivo com permissão 0600, o coletor precisa conseguir ler
+        os.chmod(tmp_file, 0o644)
+        os.replace(tmp_file, output_file)
+        logging.info("Métricas de instrumentação gravadas em {0}".format(output_file))
+
+    @classmethod
+    def _export_at_exit(cls):
+        if cls._output_file and cls._metrics:
+            try:
+                cls.export(cls._output_file)
+            except Exception as e:
+                logging.error("Não foi possível gravar as métricas de instrumentação: {0}".format(e))
@@ -1,11 +1,30 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
+import time
+
+_listener = None
+
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 class Logging:
-    
+
     @staticmethod
-    def initiate_log(log_file_mode='a', log_handle_mode='y'):
+    def initiate_log(log_file_mode='a', log_handle_mode='y', queue_mode=False, max_bytes=0, backup_count=5,
+                     max_message_length=None, rate_limit=None, rate_period=1.0, sample_rate=None):
         """
         Função para iniciar o registro de log no projeto.
 
@@ -14,6 +33,16 @@ class Logging:
                                  Se definido como 'w', os logs irão sobrescrever o arquivo da execução anterior.
             log_handle_mode (str): Modo de registro do log. Se definido como 'y' (default), os logs serão registrados no arquivo e no console.
                                    Se definido como 'n', os logs serão registrados apenas no arquivo.
+            queue_mode (bool): Se True, as chamadas de log apenas enfileiram o registro (QueueHandler) e a escrita no arquivo/console
+                               é feita por uma thread (QueueListener), sem bloquear quem chamou. A fila é esvaziada ao final do processo.
+                               Os handlers de chamadas anteriores do initiate_log são fechados e substituídos.
+            max_bytes (int): Se maior que 0, o arquivo de log é rotacionado ao atingir este tamanho (RotatingFileHandler).
+            backup_count (int): Quantidade de arquivos rotacionados mantidos quando max_bytes > 0.
+            max_message_length (int): Se informado, mensagens maiores são truncadas neste tamanho (ver LoggingTruncateFilter).
+            rate_limit (int): Se informado, limita a quantidade de mensagens abaixo de WARNING por módulo a cada rate_period segundos
+                              (ver LoggingRateLimitFilter).
+            rate_period (float): Janela, em segundos, do rate_limit.
+            sample_rate (int): Com o rate_limit atingido, mantém 1 a cada sample_rate mensagens em vez de descartar todas.
 
         Retorno:
             None
@@ -23,14 +52,126 @@ class Logging:
         projeto = os.path.basename(path)
         log_filename = os.path.join(cwd, f"{projeto}.log")
 
+        if max_bytes:
+            file_handler = logging.handlers.RotatingFileHandler(log_filename, mode=log_file_mode, maxBytes=max_bytes,
+                                                                backupCount=backup_count)
+        else:
+            file_handler = logging.FileHandler(log_filename, mode=log_file_mode)
+
         if log_handle_mode == 'y':
-            handle_mode = [logging.FileHandler(log_filename, mode=log_file_mode),
+            handle_mode = [file_handler,
                            logging.StreamHandler(sys.stdout)]
         else:
-            handle_mode = [logging.FileHandler(log_filename, mode=log_file_mode)]
+            handle_mode = [file_handler]
+
+        filters = []
+        if rate_limit:
+            filters.append(LoggingRateLimitFilter(rate_limit, rate_period, sample_rate))
+        if max_message_length:
+            filters.append(LoggingTruncateFilter(max_message_length))
+
+        log_format = '%(asctime)s.%(msecs)03d %(levelname)s %(module)s - %(funcName)s: %(message)s'
+        log_datefmt = '%d-%m-%Y %H:%M:%S'
+
+        if queue_mode:
+            global _listener
+            # Remove os handlers de chamadas anteriores (síncronos ou o QueueHandler de outro listener) para que o
+            # basicConfig registre o QueueHandler; caso contrário o log continuaria bloqueante ou enfileirando
+            # registros que nenhum listener lê
+            root = logging.getLogger()
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+                handler.close()
+            if _listener is not None:
+                previous_handlers = _listener.handlers
+                _stop_listener()
+                for handler in previous_handlers:
+                    handler.close()
+            formatter = logging.Formatter(log_format, datefmt=log_datefmt)
+            for handler in handle_mode:
+                handler.setFormatter(formatter)
+            _listener = logging.handlers.QueueListener(queue.SimpleQueue(), *handle_mode, respect_handler_level=True)
+            queue_handler = logging.handlers.QueueHandler(_listener.queue)
+            # O QueueHandler só consolida a mensagem; o formato completo é aplicado pelos handlers do listener
+            queue_handler.setFormatter(logging.Formatter('%(message)s'))
+            handle_mode = [queue_handler]
+            _listener.start()
+
+        # Os filtros ficam nos handlers (e não no logger) para valerem também para os loggers filhos
+        for handler in handle_mode:
+            for log_filter in filters:
+                handler.addFilter(log_filter)
 
         logging.basicConfig(level=logging.INFO,
-                            format='%(asctime)s.%(msecs)03d %(levelname)s %(module)s - %(funcName)s: %(message)s',
-                            datefmt='%d-%m-%Y %H:%M:%S',
+                            format=log_format,
+                            datefmt=log_datefmt,
                             handlers=handle_mode)
-        logging.info('Registro de logs iniciados no projeto!')
\ No newline at end of file
+        logging.info('Registro de logs iniciados no projeto!')
+
+
+class LoggingRateLimitFilter(logging.Filter):
+    """
+    Filtro que limita a quantidade de mensagens por módulo: a cada janela de period segundos, cada módulo registra
+    no máximo rate mensagens abaixo de WARNING. Acima do limite as mensagens são descartadas ou, com sample_rate,
+    mantidas na proporção de 1 a cada sample_rate. A primeira mensagem registrada após descartes informa quantas
+    foram suprimidas. WARNING e níveis acima nunca são descartados.
+
+    O mesmo filtro pode ser adicionado a vários handlers: a decisão é guardada no próprio registro e a mensagem é
+    contada uma única vez.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0, sample_rate: int = None):
+        super().__init__()
+        self.rate = rate
+        self.period = period
+        self.sample_rate = sample_rate
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        decision = getattr(record, '_rate_limit_allowed', None)
+        if decision is not None:
+            return decision
+        if record.levelno >= logging.WARNING:
+            record._rate_limit_allowed = True
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(record.module)
+            if window is None or now - window[0] >= self.period:
+                suppressed = window[2] if window is not None else 0
+                window = [now, 0, suppressed]
+                self._windows[record.module] = window
+            window[1] += 1
+            allowed = window[1] <= self.rate or \
+                bool(self.sample_rate and (window[1] - self.rate) % self.sample_rate == 0)
+            if not allowed:
+                window[2] += 1
+            elif window[2]:
+                record.msg = f"{record.getMessage()} ({window[2]} mensagens suprimidas)"
+                record.args = None
+                window[2] = 0
+        record._rate_limit_allowed = allowed
+        return allowed
+
+
+class LoggingTruncateFilter(logging.Filter):
+    """
+    Filtro que trunca mensagens maiores que max_length caracteres (por exemplo conteúdos de arquivos ou listas de
+    documentos), informando quantos caracteres foram omitidos.
+    """
+
+    def __init__(self, max_length: int):
+        super().__init__()
+        self.max_length = max_length
+
+    def filter(self, record):
+        if getattr(record, '_truncated', False):
+            return True
+        message = record.getMessage()
+        record._truncated = True
+        if len(message) > self.max_length:
+            record.msg = f"{message[:self.max_length]}... [+{len(message) - self.max_length} caracteres]"
+            record.args = None
+        return True
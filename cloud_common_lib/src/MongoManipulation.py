@@ -1,9 +1,39 @@
 import json
 import logging
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
-import pandas as pd
-from pymongo import MongoClient, ASCENDING, HASHED, TEXT, GEOSPHERE, DESCENDING, GEO2D
+try:
+    from .Utils import Utils
+except ImportError:
+    from Utils import Utils
+
+# Dependências carregadas apenas no primeiro uso (ver Utils.lazy_import)
+bson = Utils.lazy_import('bson')
+json_util = Utils.lazy_import('bson.json_util')
+pd = Utils.lazy_import('pandas')
+pymongo = Utils.lazy_import('pymongo')
+
+# Registro de MongoClients compartilhados pelo processo, indexado pela URI e pelas opções de conexão, e quantidade
+# de referências de cada cliente (o cliente só é fechado quando a última referência é liberada).
+_shared_clients = {}
+_shared_clients_refs = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _reset_shared_clients():
+    # MongoClient não é fork-safe: o processo filho descarta os clientes herdados e cria os seus no primeiro uso.
+    global _shared_clients_lock
+    _shared_clients.clear()
+    _shared_clients_refs.clear()
+    _shared_clients_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_shared_clients)
 
 
 class MongoManipulation:
@@ -11,7 +41,21 @@ class MongoManipulation:
     database = os.getenv('db_mongo_database')
     uri = ""
 
-    def __init__(self):
+    def __init__(self, max_pool_size: int = None, min_pool_size: int = None, compressors: str = None,
+                 socket_timeout_ms: int = None, connect_timeout_ms: int = None):
+        """
+        Parâmetros:
+            max_pool_size (int): Quantidade máxima de conexões do pool (variável de ambiente db_mongo_max_pool_size,
+                                 default 100).
+            min_pool_size (int): Quantidade mínima de conexões mantidas abertas (variável de ambiente
+                                 db_mongo_min_pool_size, default 0).
+            compressors (str): Compressores do protocolo separados por vírgula, ex: 'zstd,zlib' (variável de ambiente
+                               db_mongo_compressors, default sem compressão).
+            socket_timeout_ms (int): Timeout das operações em milissegundos (variável de ambiente
+                                     db_mongo_socket_timeout_ms, default 10800000).
+            connect_timeout_ms (int): Timeout de conexão em milissegundos (variável de ambiente
+                                      db_mongo_connect_timeout_ms, default 10800000).
+        """
         MongoManipulation.create_pem_file()
         client = dict()
         client['db_mongo_ca_cert'] = os.getenv('db_mongo_ca_cert')
@@ -27,12 +71,92 @@ class MongoManipulation:
 
         self.uri = (
             f"mongodb://{db_mongo_user}:{db_mongo_password}@{db_mongo_host_port}/{db_mongo_database}?authSource={db_mongo_parameters}"
-            f"&tls=true&tlsCAFile={db_mongo_ca_cert}&socketTimeoutMS=10800000&connectTimeoutMS=10800000"
+            f"&tls=true&tlsCAFile={db_mongo_ca_cert}"
         )
+        # Valores informados explicitamente (inclusive 0) têm precedência sobre as variáveis de ambiente
+        self.client_options = {
+            'maxPoolSize': int(max_pool_size if max_pool_size is not None
+                               else os.getenv('db_mongo_max_pool_size', 100)),
+            'minPoolSize': int(min_pool_size if min_pool_size is not None
+                               else os.getenv('db_mongo_min_pool_size', 0)),
+            'socketTimeoutMS': int(socket_timeout_ms if socket_timeout_ms is not None
+                                   else os.getenv('db_mongo_socket_timeout_ms', 10800000)),
+            'connectTimeoutMS': int(connect_timeout_ms if connect_timeout_ms is not None
+                                    else os.getenv('db_mongo_connect_timeout_ms', 10800000))
+        }
+        compressors = compressors if compressors is not None else os.getenv('db_mongo_compressors')
+        if compressors:
+            self.client_options['compressors'] = compressors
 
     def initiate_connection(self):
         """
         Função para iniciar a conexão com o MongoDB através da URI montada no __init__.
+        O MongoClient é compartilhado por todas as instâncias do processo que utilizam a mesma URI e opções,
+        reaproveitando o pool de conexões.
+
+        Parâmetros:
+            Sem Parâmetros
+
+        Retorno:
+            void: null
+        """
+        if self.client is not None:
+            MongoManipulation.release_shared_client(self.client)
+        self.client = MongoManipulation.get_shared_client(self.uri, **getattr(self, 'client_options', {}))
+
+    @staticmethod
+    def get_shared_client(uri: str, **options):
+        """
+        Função para retornar o MongoClient compartilhado pelo processo para a URI e opções informadas, criando-o
+        apenas no primeiro uso. O MongoClient é thread-safe e, após um fork, o processo filho cria o seu próprio
+        cliente. Cada chamada conta uma referência ao cliente, liberada com release_shared_client.
+
+        Parâmetros:
+            uri (str): URI de conexão com o MongoDB.
+            options (dict): Opções repassadas ao MongoClient, ex: maxPoolSize, minPoolSize, compressors.
+
+        Retorno:
+            client (MongoClient): Cliente compartilhado.
+        """
+        key = (uri, tuple(sorted(options.items())))
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = pymongo.MongoClient(uri, **options)
+                _shared_clients[key] = client
+                logging.info('Novo MongoClient criado com as opções: {0}'.format(options))
+            _shared_clients_refs[key] = _shared_clients_refs.get(key, 0) + 1
+        return client
+
+    @staticmethod
+    def release_shared_client(client):
+        """
+        Função para liberar uma referência a um MongoClient compartilhado, fechando-o apenas quando nenhuma outra
+        instância o utiliza.
+
+        Parâmetros:
+            client (MongoClient): Cliente retornado pelo get_shared_client.
+
+        Retorno:
+            bool: True se o cliente pertence ao registro de clientes compartilhados.
+        """
+        with _shared_clients_lock:
+            key = next((key for key, shared in _shared_clients.items() if shared is client), None)
+            if key is None:
+                return False
+            _shared_clients_refs[key] -= 1
+            if _shared_clients_refs[key] > 0:
+                return True
+            del _shared_clients[key]
+            del _shared_clients_refs[key]
+        client.close()
+        logging.info('MongoClient compartilhado encerrado, nenhuma instância o utiliza')
+        return True
+
+    @staticmethod
+    def close_shared_clients():
+        """
+        Função para fechar todos os MongoClients compartilhados pelo processo.
 
         Parâmetros:
             Sem Parâmetros
@@ -40,8 +164,12 @@ class MongoManipulation:
         Retorno:
             void: null
         """
-        mongo = MongoClient(self.uri)
-        self.client = mongo
+        with _shared_clients_lock:
+            for client in _shared_clients.values():
+                client.close()
+            _shared_clients.clear()
+            _shared_clients_refs.clear()
+        logging.info('Conexões compartilhadas com o MongoDB encerradas!')
 
     def select_database_mongo(self):
         """
@@ -96,13 +224,20 @@ class MongoManipulation:
 
         Retorno:
             message: void
-                Mensagem informando que o certificado foi criado
+                Mensagem informando que o certificado foi criado. O arquivo só é gravado quando o conteúdo
+                do certificado foi alterado, sendo substituído de forma atômica.
         """
         db_mongo_pem = os.getenv('db_mongo_pem_cert')
         list_cert = db_mongo_pem.strip().split("|")
-        with open("db_mongo_pem.cert", "w") as fhandle:
-            for line in list_cert:
-                fhandle.write(f'{line}\n')
+        content = ''.join(f'{line}\n' for line in list_cert)
+        if os.path.exists("db_mongo_pem.cert"):
+            with open("db_mongo_pem.cert", "r") as fhandle:
+                if fhandle.read() == content:
+                    logging.info("Certificado de conexão com o MongoDB já existente e atualizado!")
+                    return
+        with tempfile.NamedTemporaryFile("w", dir=".", prefix="db_mongo_pem.", delete=False) as fhandle:
+            fhandle.write(content)
+        os.replace(fhandle.name, "db_mongo_pem.cert")
         logging.info("Certificado de conexão com o MongoDB criado com sucesso!")
 
     @staticmethod
@@ -133,7 +268,8 @@ class MongoManipulation:
         Retorno:
             None
         """
-        index_types = [ASCENDING, HASHED, TEXT, GEOSPHERE, DESCENDING, GEO2D]
+        index_types = [pymongo.ASCENDING, pymongo.HASHED, pymongo.TEXT, pymongo.GEOSPHERE, pymongo.DESCENDING,
+                       pymongo.GEO2D]
         if type_of_index not in index_types:
             raise Exception(f'Excessão validate_index_type: Tipo de index {type_of_index} não é válido para a coluna {column}')
 
@@ -438,6 +574,106 @@ class MongoManipulation:
             logging.info('Retornando o valor mínimo para a collection {0} e coluna {1}'.format(collection, field))
             return x[field]
 
+    @staticmethod
+    def get_nested_value(document: dict, field: str):
+        """
+        Função para retornar o valor de uma coluna, mesmo aninhada (ex: 'endereco.cidade'), de um documento.
+
+        Parâmetros:
+            document (dict): Documento retornado pelo MongoDB.
+            field (str): Nome da coluna, utilizando '.' para separar os níveis.
+
+        Retorno:
+            value (any): Valor encontrado ou None caso a coluna não exista no documento.
+        """
+        value = document
+        for key in field.split('.'):
+            if not isinstance(value, dict) or key not in value:
+                return None
+            value = value[key]
+        return value
+
+    def aggregate_stats_mongo(self, collection: str, fields: list, query: dict = None, distinct: bool = True,
+                              use_index: bool = True):
+        """
+        Função para calcular mínimo, máximo, contagem, quantidade de valores distintos, quantidade de nulos e soma
+        de várias colunas da collection informada em uma única agregação ($group).
+
+        Parâmetros:
+            collection (str): Nome da collection que será utilizada.
+            fields (list): Lista com os nomes das colunas que terão as estatísticas calculadas.
+            query (dict): Filtro opcional executado no servidor ($match) antes do cálculo das estatísticas.
+            distinct (bool): Indica se a quantidade de valores distintos deve ser calculada (default True).
+                             Utiliza $addToSet, portanto deve ser desativado para colunas de alta cardinalidade
+                             devido ao limite de 16MB por documento do MongoDB.
+            use_index (bool): Indica se o mínimo e o máximo das colunas que iniciam um índice devem ser obtidos
+                              diretamente pelo índice (consulta coberta) ao invés da agregação (default True).
+
+        Retorno:
+            stats (dict): Dicionário no formato {'count': total de documentos, 'fields': {coluna: estatísticas}},
+                          onde as estatísticas de cada coluna são 'min', 'max', 'count', 'distinct', 'nulls' e 'sum'.
+        """
+        if not fields:
+            raise Exception('Excessão aggregate_stats_mongo: Nenhuma coluna foi informada')
+        mydb = self.client[self.database]
+        mycol = mydb[collection]
+        query = query or {}
+
+        indexed_fields = {}
+        if use_index:
+            for index_name, index_info in mycol.index_information().items():
+                first_key, direction = index_info['key'][0]
+                if first_key in fields and direction in (pymongo.ASCENDING, pymongo.DESCENDING):
+                    indexed_fields.setdefault(first_key, index_name)
+
+        group = {'_id': None, 'count': {'$sum': 1}}
+        project = {'_id': 0, 'count': 1}
+        for i, field in enumerate(fields):
+            alias = f'f{i}'
+            group[f'{alias}_nulls'] = {'$sum': {'$cond': [{'$gt': [f'${field}', None]}, 0, 1]}}
+            group[f'{alias}_sum'] = {'$sum': f'${field}'}
+            project[f'{alias}_nulls'] = 1
+            project[f'{alias}_sum'] = 1
+            if field not in indexed_fields:
+                group[f'{alias}_min'] = {'$min': f'${field}'}
+                group[f'{alias}_max'] = {'$max': f'${field}'}
+                project[f'{alias}_min'] = 1
+                project[f'{alias}_max'] = 1
+            if distinct:
+                group[f'{alias}_distinct'] = {'$addToSet': f'${field}'}
+                project[f'{alias}_distinct'] = {'$size': {'$filter': {
+                    'input': f'${alias}_distinct', 'as': 'value', 'cond': {'$ne': ['$$value', None]}
+                }}}
+
+        pipeline = [{'$group': group}, {'$project': project}]
+        if query:
+            pipeline.insert(0, {'$match': query})
+        result = next(iter(mycol.aggregate(pipeline, allowDiskUse=True)), {})
+
+        total = result.get('count', 0)
+        stats = {'count': total, 'fields': {}}
+        for i, field in enumerate(fields):
+            alias = f'f{i}'
+            nulls = result.get(f'{alias}_nulls', 0)
+            field_stats = {
+                'min': result.get(f'{alias}_min'),
+                'max': result.get(f'{alias}_max'),
+                'count': total - nulls,
+                'distinct': result.get(f'{alias}_distinct') if distinct else None,
+                'nulls': nulls,
+                'sum': result.get(f'{alias}_sum', 0)
+            }
+            if field in indexed_fields:
+                index_query = {'$and': [query, {field: {'$ne': None}}]} if query else {field: {'$ne': None}}
+                for key, direction in (('min', pymongo.ASCENDING), ('max', pymongo.DESCENDING)):
+                    cursor = mycol.find(index_query, {field: 1, '_id': 0}).sort(field, direction).limit(1)
+                    cursor = cursor.hint(indexed_fields[field])
+                    for doc in cursor:
+                        field_stats[key] = MongoManipulation.get_nested_value(doc, field)
+            stats['fields'][field] = field_stats
+        logging.info('Estatísticas calculadas para a collection {0} e colunas {1}'.format(collection, fields))
+        return stats
+
     def insert_data_into_mongo_from_csv(self, csv_path, collection: str, sep=',', drop_collection: bool = False):
         """
         Função para inserir novos documentos na collection informada a partir de um csv existente.
@@ -465,7 +701,8 @@ class MongoManipulation:
 
     def disconnect(self):
         """
-        Função para fechar a conexão com o MongoDB.
+        Função para encerrar a conexão desta instância com o MongoDB. O cliente compartilhado só é fechado quando
+        nenhuma outra instância o utiliza; para fechar todos os clientes utilize close_shared_clients.
 
         Parâmetros:
             Sem Parâmetros
@@ -473,7 +710,11 @@ class MongoManipulation:
         Retorno:
             void: null
         """
-        self.client.close()
+        if self.client is None:
+            return
+        if not MongoManipulation.release_shared_client(self.client):
+            self.client.close()
+        self.client = None
         
     def find_many_mongo_select_columns(self, collection: str, columns: dict):
         """
@@ -492,4 +733,402 @@ class MongoManipulation:
         data = mycol.find({}, columns)
         for entry in data:
             data_list.append(entry)
-        return data_list
\ No newline at end of file
+        return data_list
+
+    def get_range_boundaries_mongo(self, collection: str, field: str = '_id', n_ranges: int = 4, query: dict = None,
+                                   sample_size: int = 1000):
+        """
+        Função para dividir os valores de uma coluna indexada em intervalos de tamanho aproximado, a partir de uma
+        amostra ($sample) dos documentos da collection.
+
+        Parâmetros:
+            collection (str): Nome da collection que será utilizada.
+            field (str): Coluna indexada utilizada para dividir a collection (default '_id').
+            n_ranges (int): Quantidade de intervalos desejada.
+            query (dict): Filtro opcional aplicado antes da amostragem.
+            sample_size (int): Quantidade de documentos amostrados para calcular os limites dos intervalos.
+
+        Retorno:
+            ranges (list): Lista de tuplas (inicio, fim), onde o início é inclusivo, o fim é exclusivo e None indica
+                           um intervalo aberto.
+        """
+        mydb = self.client[self.database]
+        mycol = mydb[collection]
+        pipeline = [{'$sample': {'size': sample_size}}, {'$project': {field: 1}}]
+        if query:
+            pipeline.insert(0, {'$match': query})
+        values = [MongoManipulation.get_nested_value(doc, field) for doc in mycol.aggregate(pipeline)]
+        values = sorted(value for value in values if value is not None)
+
+        boundaries = []
+        for i in range(1, n_ranges):
+            if not values:
+                break
+            boundary = values[len(values) * i // n_ranges]
+            if not boundaries or boundary > boundaries[-1]:
+                boundaries.append(boundary)
+        limits = [None] + boundaries + [None]
+        ranges = list(zip(limits[:-1], limits[1:]))
+        logging.info('Foram definidos {0} intervalos para a coluna {1} da collection {2}'
+                     .format(len(ranges), field, collection))
+        return ranges
+
+    def parallel_export_mongo(self, collection: str, field: str = '_id', n_ranges: int = 4, max_workers: int = None,
+                              query: dict = None, projection: dict = None, output_dir: str = None,
+                              batch_size: int = 10000, sep: str = ','):
+        """
+        Função para exportar uma collection completa lendo intervalos da coluna informada em paralelo, utilizando o
+        mesmo MongoClient (que é thread-safe) para todas as leituras.
+
+        Parâmetros:
+            collection (str): Nome da collection que será exportada.
+            field (str): Coluna indexada utilizada para dividir a collection (default '_id'). A coluna deve possuir
+                         um único tipo de dado, pois as consultas por intervalo do MongoDB comparam apenas valores
+                         do mesmo tipo.
+            n_ranges (int): Quantidade de intervalos lidos em paralelo.
+            max_workers (int): Quantidade máxima de leituras simultâneas. Por padrão utiliza n_ranges.
+            query (dict): Filtro opcional aplicado em todas as leituras.
+            projection (dict): Colunas que serão retornadas, no mesmo formato do find do MongoDB.
+            output_dir (str): Diretório local (ex: 'files/raw/pasta') onde cada intervalo será gravado como um arquivo
+                              CSV. Se não for informado, os dados são retornados em um único DataFrame.
+            batch_size (int): Quantidade de documentos retornados pelo servidor a cada lote do cursor.
+            sep (str): Separador utilizado nos arquivos CSV gerados.
+
+        Retorno:
+            pd.DataFrame | list: DataFrame com todos os documentos ou lista com os caminhos dos arquivos gerados.
+        """
+        mydb = self.client[self.database]
+        mycol = mydb[collection]
+        ranges = self.get_range_boundaries_mongo(collection, field, n_ranges, query)
+        range_queries = []
+        for start, end in ranges:
+            condition = {}
+            if start is not None:
+                condition['$gte'] = start
+            if end is not None:
+                condition['$lt'] = end
+            range_queries.append({field: condition} if condition else {})
+        if field != '_id' and range_queries != [{}]:
+            range_queries.append({field: None})
+        if query:
+            range_queries = [{'$and': [query, range_query]} for range_query in range_queries]
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        def read_range(position):
+            cursor = mycol.find(range_queries[position], projection).batch_size(batch_size)
+            df_range = pd.DataFrame(list(cursor))
+            if not output_dir:
+                return df_range
+            file_name = os.path.join(output_dir, f'{collection}_part-{position:05d}.csv')
+            df_range.to_csv(file_name, sep=sep, index=False)
+            return file_name
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(range_queries)) as executor:
+            results = list(executor.map(read_range, range(len(range_queries))))
+        logging.info('A collection {0} foi exportada em {1} intervalos'.format(collection, len(range_queries)))
+        if output_dir:
+            return results
+        return pd.concat(results, ignore_index=True)
+
+    @staticmethod
+    def get_watermark_mongo(key: str, watermark_file: str = 'files/watermarks.json'):
+        """
+        Função para retornar a última marca d'água (watermark) registrada para uma extração incremental.
+
+        Parâmetros:
+            key (str): Identificador da extração, no formato 'database.collection.coluna'.
+            watermark_file (str): Caminho do arquivo JSON onde as marcas d'água são armazenadas.
+
+        Retorno:
+            watermark (dict): Dicionário com o último valor da coluna ('value') e o último _id ('_id') processados,
+                              ou None caso a extração ainda não tenha sido executada.
+        """
+        if not os.path.exists(watermark_file):
+            return None
+        with open(watermark_file, 'r', encoding='utf-8') as fhandle:
+            watermarks = json_util.loads(fhandle.read() or '{}')
+        return watermarks.get(key)
+
+    @staticmethod
+    def commit_watermark_mongo(key: str, watermark: dict, watermark_file: str = 'files/watermarks.json'):
+        """
+        Função para registrar de forma atômica a marca d'água (watermark) de uma extração incremental.
+        O arquivo é gravado em um arquivo temporário e renomeado, evitando que uma falha durante a escrita
+        corrompa as marcas d'água já registradas.
+
+        Parâmetros:
+            key (str): Identificador da extração, no formato 'database.collection.coluna'.
+            watermark (dict): Dicionário com o último valor da coluna ('value') e o último _id ('_id') processados.
+            watermark_file (str): Caminho do arquivo JSON onde as marcas d'água são armazenadas.
+
+        Retorno:
+            None
+        """
+        directory = os.path.dirname(watermark_file) or '.'
+        os.makedirs(directory, exist_ok=True)
+        watermarks = {}
+        if os.path.exists(watermark_file):
+            with open(watermark_file, 'r', encoding='utf-8') as fhandle:
+                watermarks = json_util.loads(fhandle.read() or '{}')
+        watermarks[key] = watermark
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, delete=False) as fhandle:
+            fhandle.write(json_util.dumps(watermarks, indent=2))
+            fhandle.flush()
+            os.fsync(fhandle.fileno())
+        os.replace(fhandle.name, watermark_file)
+        logging.info("Marca d'água da extração {0} registrada: {1}".format(key, watermark))
+
+    def find_incremental_mongo(self, collection: str, field: str = '_id', watermark_file: str = 'files/watermarks.json',
+                               batch_size: int = 1000, query: dict = None, projection: dict = None, start=None):
+        """
+        Função para retornar, em lotes, apenas os documentos inseridos ou atualizados após a última marca d'água
+        registrada. Cada lote é obtido por uma nova consulta ordenada pela coluna informada (e pelo _id, para
+        desempate), portanto a coluna deve ser monotônica e indexada. A marca d'água não é registrada por esta
+        função: utilize commit_watermark_mongo após o processamento do lote ou a função process_incremental_mongo.
+
+        Parâmetros:
+            collection (str): Nome da collection que será lida.
+            field (str): Coluna monotônica utilizada como marca d'água, ex: '_id' (ObjectId) ou 'updatedAt'.
+                         Documentos com a coluna nula ou inexistente não são retornados.
+            watermark_file (str): Caminho do arquivo JSON onde as marcas d'água são armazenadas.
+            batch_size (int): Quantidade de documentos de cada lote.
+            query (dict): Filtro opcional aplicado em todas as consultas.
+            projection (dict): Colunas que serão retornadas, no mesmo formato do find do MongoDB.
+            start (any): Valor inicial (inclusivo) utilizado quando não existe marca d'água registrada.
+                         Se a coluna for '_id', pode ser informado um datetime, convertido para ObjectId.
+
+        Retorno:
+            generator: Tuplas (lote, watermark), onde lote é a lista de documentos e watermark é a marca d'água
+                       que deve ser registrada após o processamento do lote.
+        """
+        mydb = self.client[self.database]
+        mycol = mydb[collection]
+        key = f'{self.database}.{collection}.{field}'
+        watermark = MongoManipulation.get_watermark_mongo(key, watermark_file)
+
+        if projection:
+            projection = {column: value for column, value in projection.items()
+                          if column not in (field, '_id') or value}
+            if any(projection.values()):
+                projection[field] = 1
+        projection = projection or None
+
+        sort = [('_id', pymongo.ASCENDING)] if field == '_id' \
+            else [(field, pymongo.ASCENDING), ('_id', pymongo.ASCENDING)]
+        total = 0
+        while True:
+            if watermark is None:
+                if start is None:
+                    condition = {field: {'$ne': None}}
+                elif field == '_id' and isinstance(start, datetime):
+                    condition = {'_id': {'$gte': bson.ObjectId.from_datetime(start)}}
+                else:
+                    condition = {field: {'$gte': start}}
+            elif field == '_id':
+                condition = {'_id': {'$gt': watermark['value']}}
+            else:
+                condition = {'$or': [{field: {'$gt': watermark['value']}},
+                                     {field: watermark['value'], '_id': {'$gt': watermark['_id']}}]}
+            if query:
+                condition = {'$and': [query, condition]}
+
+            batch = list(mycol.find(condition, projection).sort(sort).limit(batch_size))
+            if not batch:
+                break
+            last = batch[-1]
+            watermark = {'value': MongoManipulation.get_nested_value(last, field), '_id': last['_id']}
+            total += len(batch)
+            yield batch, watermark
+            if len(batch) < batch_size:
+                break
+        logging.info('Foram retornados {0} novos documentos da collection {1}'.format(total, collection))
+
+    def process_incremental_mongo(self, collection: str, callback, field: str = '_id',
+                                  watermark_file: str = 'files/watermarks.json', batch_size: int = 1000,
+                                  query: dict = None, projection: dict = None, start=None):
+        """
+        Função para processar de forma incremental os novos documentos da collection informada. Cada lote é
+        entregue para a função callback e a marca d'água só é registrada após o callback ser concluído sem erros,
+        permitindo que uma execução interrompida seja retomada a partir do último lote processado.
+
+        Parâmetros:
+            collection (str): Nome da collection que será lida.
+            callback (callable): Função que recebe a lista de documentos de cada lote (ex: gravação em arquivo ou
+                                 carga no Postgres).
+            field (str): Coluna monotônica utilizada como marca d'água, ex: '_id' (ObjectId) ou 'updatedAt'.
+            watermark_file (str): Caminho do arquivo JSON onde as marcas d'água são armazenadas.
+            batch_size (int): Quantidade de documentos de cada lote.
+            query (dict): Filtro opcional aplicado em todas as consultas.
+            projection (dict): Colunas que serão retornadas, no mesmo formato do find do MongoDB.
+            start (any): Valor inicial (inclusivo) utilizado quando não existe marca d'água registrada.
+
+        Retorno:
+            total (int): Quantidade de documentos processados.
+        """
+        key = f'{self.database}.{collection}.{field}'
+        total = 0
+        for batch, watermark in self.find_incremental_mongo(collection, field, watermark_file, batch_size, query,
+                                                            projection, start):
+            callback(batch)
+            MongoManipulation.commit_watermark_mongo(key, watermark, watermark_file)
+            total += len(batch)
+        return total
+
+    def aggregate_mongo(self, collection: str, pipeline, batch_size: int = 1000, allow_disk_use: bool = True,
+                        as_dataframe: bool = False, chunk_size: int = None):
+        """
+        Função para executar um pipeline de agregação no servidor, trafegando apenas o resultado das etapas
+        de filtro, projeção, agrupamento, ordenação e limite.
+
+        Parâmetros:
+            collection (str): Nome da collection que será utilizada.
+            pipeline (list | MongoPipeline): Lista de etapas do pipeline de agregação ou um MongoPipeline.
+            batch_size (int): Quantidade de documentos retornados pelo servidor a cada lote do cursor.
+            allow_disk_use (bool): Permite que o servidor utilize disco em etapas que excedam o limite de memória
+                                   (default True).
+            as_dataframe (bool): Indica se o resultado deve ser retornado como DataFrame (default False).
+            chunk_size (int): Quando informado junto com as_dataframe, retorna um gerador de DataFrames com no
+                              máximo chunk_size linhas cada, ao invés de um único DataFrame.
+
+        Retorno:
+            CommandCursor | pd.DataFrame | generator: Cursor que percorre o resultado em lotes, DataFrame com o
+                                                      resultado ou gerador de DataFrames.
+        """
+        if isinstance(pipeline, MongoPipeline):
+            pipeline = pipeline.build()
+        mydb = self.client[self.database]
+        mycol = mydb[collection]
+        logging.info('Executando pipeline de agregação na collection {0}: {1}'.format(collection, pipeline))
+        cursor = mycol.aggregate(pipeline, allowDiskUse=allow_disk_use, batchSize=batch_size)
+        if not as_dataframe:
+            return cursor
+        if chunk_size:
+            return MongoManipulation.iterate_dataframe_chunks(cursor, chunk_size)
+        return pd.DataFrame(list(cursor))
+
+    @staticmethod
+    def iterate_dataframe_chunks(cursor, chunk_size: int):
+        """
+        Função para converter um cursor do MongoDB em DataFrames com tamanho limitado.
+
+        Parâmetros:
+            cursor (Cursor | CommandCursor): Cursor com os documentos.
+            chunk_size (int): Quantidade máxima de linhas de cada DataFrame.
+
+        Retorno:
+            generator: DataFrames com no máximo chunk_size linhas cada.
+        """
+        chunk = []
+        for doc in cursor:
+            chunk.append(doc)
+            if len(chunk) == chunk_size:
+                yield pd.DataFrame(chunk)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk)
+
+
+class MongoPipeline:
+    """
+    Construtor simples de pipelines de agregação do MongoDB, para uso com MongoManipulation.aggregate_mongo.
+
+    Exemplo:
+        pipeline = (MongoPipeline()
+                    .match({'status': 'ativo'})
+                    .group('$estado', total={'$sum': '$valor'})
+                    .sort({'total': -1})
+                    .limit(10))
+    """
+
+    def __init__(self):
+        self.stages = []
+
+    def match(self, query: dict):
+        """
+        Função para adicionar uma etapa de filtro ($match).
+
+        Parâmetros:
+            query (dict): Filtro no mesmo formato do find do MongoDB.
+
+        Retorno:
+            MongoPipeline: O próprio pipeline, permitindo encadear as chamadas.
+        """
+        return self.add_stage({'$match': query})
+
+    def project(self, fields):
+        """
+        Função para adicionar uma etapa de projeção ($project).
+
+        Parâmetros:
+            fields (list | dict): Lista de colunas que serão mantidas ou dicionário no formato do $project.
+
+        Retorno:
+            MongoPipeline: O próprio pipeline, permitindo encadear as chamadas.
+        """
+        if isinstance(fields, (list, tuple)):
+            fields = {field: 1 for field in fields}
+        return self.add_stage({'$project': fields})
+
+    def group(self, key, **accumulators):
+        """
+        Função para adicionar uma etapa de agrupamento ($group).
+
+        Parâmetros:
+            key (str | dict | None): Chave do agrupamento, ex: '$estado', {'estado': '$estado', 'ano': '$ano'} ou
+                                     None para agrupar todos os documentos.
+            accumulators (dict): Colunas calculadas e seus acumuladores, ex: total={'$sum': '$valor'}.
+
+        Retorno:
+            MongoPipeline: O próprio pipeline, permitindo encadear as chamadas.
+        """
+        return self.add_stage({'$group': dict({'_id': key}, **accumulators)})
+
+    def sort(self, fields):
+        """
+        Função para adicionar uma etapa de ordenação ($sort).
+
+        Parâmetros:
+            fields (dict | list): Colunas e direção da ordenação, ex: {'total': -1} ou [('total', -1)].
+
+        Retorno:
+            MongoPipeline: O próprio pipeline, permitindo encadear as chamadas.
+        """
+        return self.add_stage({'$sort': dict(fields)})
+
+    def limit(self, quantity: int):
+        """
+        Função para adicionar uma etapa de limite ($limit).
+
+        Parâmetros:
+            quantity (int): Quantidade máxima de documentos retornados.
+
+        Retorno:
+            MongoPipeline: O próprio pipeline, permitindo encadear as chamadas.
+        """
+        return self.add_stage({'$limit': quantity})
+
+    def add_stage(self, stage: dict):
+        """
+        Função para adicionar uma etapa qualquer ao pipeline, ex: {'$unwind': '$itens'}.
+
+        Parâmetros:
+            stage (dict): Etapa do pipeline de agregação.
+
+        Retorno:
+            MongoPipeline: O próprio pipeline, permitindo encadear as chamadas.
+        """
+        self.stages.append(stage)
+        return self
+
+    def build(self):
+        """
+        Função para retornar a lista de etapas do pipeline.
+
+        Parâmetros:
+            Sem Parâmetros
+
+        Retorno:
+            stages (list): Etapas do pipeline de agregação.
+        """
+        return list(self.stages)
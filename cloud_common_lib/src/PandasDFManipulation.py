@@ -1,8 +1,24 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import json
 import logging
-import pandas as pd
+import os
+import re
+import tempfile
 from datetime import datetime
 from typing import List
 
+try:
+    from .Utils import Utils
+except ImportError:
+    from Utils import Utils
+
+# Dependências carregadas apenas no primeiro uso (ver Utils.lazy_import)
+np = Utils.lazy_import('numpy')
+pd = Utils.lazy_import('pandas')
+
 
 class PandasDFManipulation:
 
@@ -96,6 +112,72 @@ class PandasDFManipulation:
         df.loc[:, composted_column] = final_value
         return df
 
+    @staticmethod
+    def build_composite_key(df: pd.DataFrame, columns: List[str], composted_column: str, separator: str = "|",
+                            null_value: str = "", hashed: bool = False):
+        """
+        Função para criar uma chave composta a partir de N colunas, de forma vetorizada.
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame onde será criada a chave composta
+
+            columns: List[str]
+                Colunas utilizadas para criar a chave, na ordem informada
+
+            composted_column: String
+                Nome da coluna da chave composta
+
+            separator: String
+                Separador inserido entre os valores das colunas (default '|')
+
+            null_value: String
+                Texto utilizado no lugar dos valores nulos (default '')
+
+            hashed: bool
+                Se True, a chave é um hash de 64 bits (int64) das colunas ao invés da concatenação dos textos,
+                indicada para joins e remoção de duplicados. O hash depende do dtype das colunas, que deve ser o
+                mesmo entre execuções que serão comparadas
+
+        Retorno:
+            df: pd.DataFrame
+                Dataframe com a chave composta
+        """
+        logging.info("Gerando a chave composta {0} a partir das colunas {1}".format(composted_column, columns))
+
+        if hashed:
+            df[composted_column] = PandasDFManipulation.hash_columns(df, columns)
+            return df
+
+        texts = []
+        for column in columns:
+            series = df[column]
+            if not (isinstance(series.dtype, pd.StringDtype)
+                    or pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty')):
+                series = series.astype(str).where(series.notna())
+            texts.append(series)
+        df[composted_column] = texts[0].str.cat(texts[1:], sep=separator, na_rep=null_value)
+        return df
+
+    @staticmethod
+    def hash_columns(df: pd.DataFrame, columns: List[str]):
+        """
+        Função para calcular, de forma vetorizada, um hash de 64 bits por linha a partir das colunas informadas.
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame de origem
+
+            columns: List[str]
+                Colunas utilizadas no cálculo do hash
+
+        Retorno:
+            hashes: np.ndarray
+                Array int64 com o hash de cada linha
+        """
+        hashes = pd.util.hash_pandas_object(df[list(columns)], index=False)
+        return hashes.to_numpy().view(np.int64)
+
     @staticmethod
     def drop_nulls_from_column(df, column: str):
         """
@@ -179,6 +261,52 @@ class PandasDFManipulation:
         df.replace(r'\s*(.*?)\s*', r'\1', regex=True, inplace=True)
         return df
 
+    @staticmethod
+    def strip_string_columns(df: pd.DataFrame, columns: List[str] = None, use_categories: bool = False):
+        """
+        Função para remover, de forma vetorizada, os espaços do início e do fim dos valores das colunas string.
+        Diferente do strip_df, apenas as colunas object/string são percorridas, as demais colunas não são copiadas
+        e os espaços internos dos valores são mantidos. Colunas com dtype 'string[pyarrow]' utilizam os kernels
+        de string do Arrow.
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame onde será realizado o strip (alterado no próprio objeto)
+
+            columns: List[str]
+                Colunas que serão tratadas. Por padrão todas as colunas object e string do DataFrame
+
+            use_categories: bool
+                Se True, o strip é executado uma única vez por valor distinto da coluna (via pd.factorize),
+                indicado para colunas com muitos valores repetidos
+
+        Retorno:
+            df: pd.Dataframe
+                Dataframe com as colunas string sem espaços no início e no fim dos valores
+        """
+        if columns is None:
+            columns = df.select_dtypes(include=['object', 'string']).columns
+        logging.info("Removendo os espaços das colunas string: {0}".format(list(columns)))
+
+        for column in columns:
+            series = df[column]
+            if isinstance(series.dtype, pd.StringDtype):
+                df[column] = series.str.strip()
+            elif use_categories:
+                codes, uniques = pd.factorize(series)
+                uniques = pd.Series(uniques, dtype=object)
+                stripped = uniques.str.strip()
+                stripped = stripped.where(stripped.notna(), uniques).to_numpy(dtype=object)
+                values = series.to_numpy(dtype=object, copy=True)
+                valid = codes != -1
+                values[valid] = stripped[codes[valid]]
+                df[column] = values
+            else:
+                # Valores que não são string (ex: números em colunas object) são mantidos sem alteração
+                stripped = series.str.strip()
+                df[column] = stripped.where(stripped.notna(), series)
+        return df
+
     @staticmethod
     def create_dataframe_from_file(file: str = "", separador: str = ""):
         """
@@ -209,3 +337,1125 @@ class PandasDFManipulation:
 
         logging.info("Dataframe criado")
         return df
+
+    @staticmethod
+    def filter_rows_using_values_list(df: pd.DataFrame, column_name: str, values_filter: List):
+        """
+        Função para filtrar, em uma única passada, as linhas que possuem qualquer um dos valores informados.
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame onde será filtrado os valores
+
+            column_name: String
+                Nome da coluna onde serão buscados os valores
+
+            values_filter: List
+                Valores que serão filtrados na coluna
+
+        Retorno:
+            df: pd.Dataframe
+                Dataframe com as linhas contendo algum dos valores filtrados
+        """
+        logging.info("Filtrando dados da coluna {0} contendo os valores {1}".format(column_name, values_filter))
+
+        return df.loc[df[column_name].isin(values_filter)]
+
+    @staticmethod
+    def create_value_index(df: pd.DataFrame, column_name: str):
+        """
+        Função para criar um índice de valores da coluna informada, permitindo retornar as linhas de um ou vários
+        valores (ou de todos os grupos) sem percorrer a coluna novamente a cada consulta.
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame que será indexado
+
+            column_name: String
+                Nome da coluna utilizada no índice
+
+        Retorno:
+            index: PandasDFValueIndex
+                Índice com os métodos get, get_many e groups
+        """
+        logging.info("Criando índice de valores para a coluna {0}".format(column_name))
+
+        return PandasDFValueIndex(df, column_name)
+
+    @staticmethod
+    def create_dataframe_from_file_profiled(file: str = "", separador: str = None, profile_dir: str = "files/.profiles",
+                                            source_pattern: str = None, usecols: List[str] = None, engine: str = None,
+                                            refresh: bool = False):
+        """
+        Função para retornar um dataframe a partir de um arquivo CSV utilizando um perfil da fonte armazenado em
+        cache. Na primeira leitura o delimitador, o encoding e os dtypes compactos de cada coluna são identificados
+        e gravados em um arquivo JSON por padrão de fonte. Nas leituras seguintes o arquivo é lido com os dtypes
+        explícitos, sem a inferência de tipos do pandas. Se o arquivo não for compatível com o perfil, um novo perfil
+        é gerado.
+
+        Parâmetros:
+            file: String
+                Caminho completo para o arquivo csv que será transformado em um dataframe
+
+            separador: String
+                Delimitador de colunas. Se não for informado, é identificado automaticamente
+
+            profile_dir: String
+                Diretório onde os perfis são armazenados
+
+            source_pattern: String
+                Padrão da fonte que compartilha o mesmo perfil. Por padrão o nome do arquivo com os números
+                substituídos por '*', ex: vendas_20240101.csv -> vendas_*.csv
+
+            usecols: List[str]
+                Colunas que serão lidas do arquivo. Por padrão todas
+
+            engine: String
+                Engine de leitura do pandas, ex: 'pyarrow' para leitura multi-thread (requer o pyarrow instalado)
+
+            refresh: bool
+                Se True, o perfil é gerado novamente mesmo que já exista
+
+        Retorno:
+            df: pd.DataFrame
+                Dataframe contendo as informações do arquivo csv original
+        """
+        source_pattern = source_pattern or re.sub(r'\d+', '*', os.path.basename(file))
+        profile_file = os.path.join(profile_dir, re.sub(r'[^\w.-]', '_', source_pattern) + '.json')
+
+        if os.path.exists(profile_file) and not refresh:
+            with open(profile_file, 'r', encoding='utf-8') as fhandle:
+                profile = json.load(fhandle)
+            columns = usecols or profile['columns']
+            read_dtypes = {column: PandasDFManipulation.read_dtype(profile['dtypes'][column])
+                           for column in columns if column in profile['dtypes']}
+            # Colunas sem dtype de leitura (texto, datas) são inferidas pelo pandas
+            read_dtypes = {column: dtype for column, dtype in read_dtypes.items() if dtype is not None}
+            try:
+                logging.info("Criando dataframe a partir do arquivo {0} com o perfil {1}".format(file, profile_file))
+                df = pd.read_csv(file, sep=profile['sep'], encoding=profile['encoding'], dtype=read_dtypes,
+                                 usecols=usecols, engine=engine)
+                for column in df.columns:
+                    if column in profile['dtypes']:
+                        df[column] = PandasDFManipulation.safe_cast(df[column], profile['dtypes'][column])
+                logging.info("Dataframe criado")
+                return df
+            except (ValueError, TypeError, OverflowError, UnicodeDecodeError) as e:
+                logging.warning("O arquivo {0} não é compatível com o perfil {1}, gerando um novo perfil: {2}"
+                                .format(file, profile_file, e))
+
+        logging.info("Gerando o perfil da fonte {0} a partir do arquivo {1}".format(source_pattern, file))
+        with open(file, 'rb') as fhandle:
+            sample = fhandle.read(65536)
+        encoding = 'utf-8-sig' if sample.startswith(codecs.BOM_UTF8) else 'utf-8'
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+        except UnicodeDecodeError:
+            encoding = 'latin-1'
+        if not separador:
+            try:
+                separador = csv.Sniffer().sniff(sample.decode(encoding, errors='ignore'), delimiters=',;|\t').delimiter
+            except csv.Error:
+                separador = ','
+        # low_memory só é suportado pela engine C (padrão)
+        read_options = {'low_memory': False} if engine in (None, 'c') else {}
+        try:
+            df = pd.read_csv(file, sep=separador, encoding=encoding, engine=engine, **read_options)
+        except UnicodeDecodeError:
+            encoding = 'latin-1'
+            df = pd.read_csv(file, sep=separador, encoding=encoding, engine=engine, **read_options)
+
+        dtypes = {}
+        for column in df.columns:
+            dtypes[column] = PandasDFManipulation.compact_dtype(df[column])
+            df[column] = PandasDFManipulation.safe_cast(df[column], dtypes[column])
+        profile = {
+            'source_pattern': source_pattern,
+            'sep': separador,
+            'encoding': encoding,
+            'columns': list(df.columns),
+            'dtypes': dtypes,
+            'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        os.makedirs(profile_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=profile_dir, delete=False) as fhandle:
+            json.dump(profile, fhandle, indent=2)
+        os.replace(fhandle.name, profile_file)
+        logging.info("Perfil da fonte gravado em {0}: {1}".format(profile_file, dtypes))
+
+        if usecols:
+            df = df[[column for column in df.columns if column in usecols]]
+        logging.info("Dataframe criado")
+        return df
+
+    @staticmethod
+    def compact_dtype(series: pd.Series, categorical_threshold: float = 0.5):
+        """
+        Função para identificar o menor dtype capaz de representar os valores de uma coluna sem perda de informação.
+
+        Parâmetros:
+            series: pd.Series
+                Coluna que será analisada
+
+            categorical_threshold: float
+                Proporção máxima de valores distintos em relação ao total de linhas para que uma coluna string seja
+                convertida para category
+
+        Retorno:
+            dtype: String
+                Nome do dtype compacto, ex: 'int16', 'Int32' (inteiro com nulos), 'float32', 'category'
+        """
+        return PandasDFManipulation._compact_dtype(series, categorical_threshold, bool(series.isna().any()))
+
+    @staticmethod
+    def _compact_dtype(series: pd.Series, categorical_threshold: float, has_nulls: bool, cardinality: int = None,
+                       inferred: str = None):
+        # Versão do compact_dtype que reaproveita nulos, cardinalidade e tipo inferido já calculados pelo chamador
+        if pd.api.types.is_bool_dtype(series.dtype):
+            return 'boolean' if has_nulls else 'bool'
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            values = series.dropna() if has_nulls else series
+            if values.empty:
+                return str(series.dtype)
+            is_integer = pd.api.types.is_integer_dtype(series.dtype) or (
+                pd.api.types.is_float_dtype(series.dtype) and bool((values % 1 == 0).all()))
+            if is_integer:
+                minimum, maximum = values.min(), values.max()
+                for dtype in ('int8', 'int16', 'int32', 'int64'):
+                    if np.iinfo(dtype).min <= minimum and maximum <= np.iinfo(dtype).max:
+                        return dtype.capitalize() if has_nulls else dtype
+                return str(series.dtype)
+            if pd.api.types.is_float_dtype(series.dtype):
+                float32 = values.astype('float32').astype(values.dtype)
+                return 'float32' if bool((float32 == values).all()) else str(series.dtype)
+            return str(series.dtype)
+        if inferred is None:
+            inferred = pd.api.types.infer_dtype(series, skipna=True)
+        if inferred == 'string' and len(series):
+            if cardinality is None:
+                cardinality = series.nunique(dropna=True)
+            if cardinality / len(series) <= categorical_threshold:
+                return 'category'
+        return str(series.dtype)
+
+    @staticmethod
+    def read_dtype(dtype: str):
+        """
+        Função para retornar o dtype utilizado na leitura de um CSV para uma coluna com o dtype compacto informado.
+        Inteiros são lidos como Int64 e floats como float64, pois o pandas não valida o intervalo de dtypes menores
+        durante a leitura, e então convertidos com o safe_cast.
+
+        Parâmetros:
+            dtype: String
+                dtype compacto da coluna
+
+        Retorno:
+            dtype: String
+                dtype utilizado na leitura ou None para deixar o pandas inferir (a coluna não deve ser incluída no
+                parâmetro dtype do read_csv, onde None equivale a float64)
+        """
+        if dtype.lower().startswith(('int', 'uint')):
+            return 'Int64'
+        if dtype.startswith('float'):
+            return 'float64'
+        if dtype in ('bool', 'boolean'):
+            return 'boolean'
+        if dtype in ('category', 'object', 'string'):
+            return dtype
+        return None
+
+    @staticmethod
+    def safe_cast(series: pd.Series, dtype: str):
+        """
+        Função para converter uma coluna para o dtype informado apenas se não houver perda de informação.
+
+        Parâmetros:
+            series: pd.Series
+                Coluna que será convertida
+
+            dtype: String
+                dtype desejado
+
+        Retorno:
+            series: pd.Series
+                Coluna convertida ou a coluna original quando a conversão não é segura
+        """
+        if str(series.dtype) == dtype:
+            return series
+        try:
+            has_nulls = bool(series.isna().any())
+            if dtype.lower().startswith(('int', 'uint')):
+                values = series.dropna()
+                info = np.iinfo(dtype.lower())
+                if not values.empty and (values.min() < info.min or values.max() > info.max
+                                         or not bool((values % 1 == 0).all())):
+                    return series
+                dtype = dtype.lower().replace('uint', 'UInt').replace('int', 'Int') if has_nulls else dtype.lower()
+            elif dtype == 'float32':
+                values = series.dropna().astype('float64')
+                if not bool((values.astype('float32').astype('float64') == values).all()):
+                    return series
+            elif dtype == 'bool' and has_nulls:
+                dtype = 'boolean'
+            return series.astype(dtype)
+        except (TypeError, ValueError):
+            return series
+
+    @staticmethod
+    def detect_changes(df: pd.DataFrame, key_columns: List[str], value_columns: List[str] = None,
+                       hash_index_file: str = None):
+        """
+        Função para identificar as linhas inseridas, atualizadas e apagadas em relação à execução anterior,
+        comparando hashes de 64 bits das linhas com o índice de hashes gravado anteriormente. O novo índice não é
+        gravado por esta função: utilize save_hash_index após a carga das alterações ser concluída.
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame com a versão atual dos dados
+
+            key_columns: List[str]
+                Colunas que identificam cada linha (chave)
+
+            value_columns: List[str]
+                Colunas comparadas para identificar as atualizações. Por padrão todas as colunas que não são chave.
+                O hash depende do dtype das colunas, que deve ser o mesmo entre as execuções. Sem colunas de valor
+                (lista vazia ou todas as colunas são chave) apenas inserções e exclusões são identificadas
+
+            hash_index_file: String
+                Caminho do índice de hashes da execução anterior (.parquet ou .npz). Se não existir, todas as
+                linhas são consideradas inseridas
+
+        Retorno:
+            changes: dict
+                Dicionário com os DataFrames 'inserted' e 'updated' (linhas do df), 'deleted' (colunas chave das
+                linhas que não existem mais; texto quando o índice é .npz) e 'index' (novo índice de hashes)
+        """
+        if value_columns is None:
+            value_columns = [column for column in df.columns if column not in key_columns]
+        key_hash = PandasDFManipulation.hash_columns(df, key_columns)
+        if value_columns:
+            row_hash = PandasDFManipulation.hash_columns(df, value_columns)
+        else:
+            row_hash = np.zeros(len(df), dtype=np.int64)
+        index = df[list(key_columns)].reset_index(drop=True)
+        index['_key_hash'] = key_hash
+        index['_row_hash'] = row_hash
+
+        previous = PandasDFManipulation.load_hash_index(hash_index_file) if hash_index_file else None
+        if previous is None:
+            inserted = np.ones(len(df), dtype=bool)
+            updated = np.zeros(len(df), dtype=bool)
+            deleted = previous
+        else:
+            previous = previous.drop_duplicates('_key_hash', keep='last')
+            positions = pd.Index(previous['_key_hash'].to_numpy()).get_indexer(key_hash)
+            inserted = positions == -1
+            previous_row_hash = previous['_row_hash'].to_numpy()[positions]
+            updated = ~inserted & (previous_row_hash != row_hash)
+            deleted = previous.loc[~previous['_key_hash'].isin(key_hash), list(key_columns)]
+
+        changes = {
+            'inserted': df.loc[inserted],
+            'updated': df.loc[updated],
+            'deleted': deleted.reset_index(drop=True) if deleted is not None else df.loc[[], list(key_columns)],
+            'index': index
+        }
+        logging.info("Foram identificadas {0} inserções, {1} atualizações e {2} exclusões"
+                     .format(len(changes['inserted']), len(changes['updated']), len(changes['deleted'])))
+        return changes
+
+    @staticmethod
+    def save_hash_index(index: pd.DataFrame, hash_index_file: str):
+        """
+        Função para gravar o índice de hashes retornado pelo detect_changes. Arquivos .parquet mantêm os dtypes
+        das colunas chave; arquivos .npz gravam as colunas chave como texto.
+
+        Parâmetros:
+            index: pd.DataFrame
+                Índice de hashes ('index' do retorno do detect_changes)
+
+            hash_index_file: String
+                Caminho do arquivo (.parquet ou .npz)
+
+        Retorno:
+            None
+        """
+        directory = os.path.dirname(hash_index_file) or '.'
+        os.makedirs(directory, exist_ok=True)
+        extension = os.path.splitext(hash_index_file)[1]
+        temp_file = os.path.join(directory, f'.{os.path.basename(hash_index_file)}.tmp{extension}')
+        if extension == '.npz':
+            arrays = {column: index[column].astype(str).to_numpy(dtype=str) for column in index.columns
+                      if column not in ('_key_hash', '_row_hash')}
+            np.savez(temp_file, _key_hash=index['_key_hash'].to_numpy(), _row_hash=index['_row_hash'].to_numpy(),
+                     _columns=np.array(list(arrays), dtype=str), **arrays)
+        else:
+            Utils.require_module('pyarrow', 'parquet')
+            index.to_parquet(temp_file, index=False)
+        os.replace(temp_file, hash_index_file)
+        logging.info("Índice de hashes gravado em {0}".format(hash_index_file))
+
+    @staticmethod
+    def load_hash_index(hash_index_file: str):
+        """
+        Função para ler um índice de hashes gravado pelo save_hash_index.
+
+        Parâmetros:
+            hash_index_file: String
+                Caminho do arquivo (.parquet ou .npz)
+
+        Retorno:
+            index: pd.DataFrame
+                Índice de hashes ou None caso o arquivo não exista
+        """
+        if not os.path.exists(hash_index_file):
+            return None
+        if hash_index_file.endswith('.npz'):
+            with np.load(hash_index_file) as arrays:
+                index = pd.DataFrame({column: arrays[column] for column in arrays['_columns']})
+                index['_key_hash'] = arrays['_key_hash']
+                index['_row_hash'] = arrays['_row_hash']
+            return index
+        Utils.require_module('pyarrow', 'parquet')
+        return pd.read_parquet(hash_index_file)
+
+    @staticmethod
+    def profile_memory(df: pd.DataFrame, categorical_threshold: float = 0.5, use_arrow_strings: bool = False):
+        """
+        Função para gerar um relatório de memória do DataFrame, com o consumo real (deep) de cada coluna,
+        a quantidade de valores distintos, a proporção de nulos e o dtype compacto sugerido.
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame que será analisado
+
+            categorical_threshold: float
+                Proporção máxima de valores distintos para que uma coluna string seja sugerida como category
+
+            use_arrow_strings: bool
+                Se True, colunas string de alta cardinalidade são sugeridas como 'string[pyarrow]'
+
+        Retorno:
+            report: pd.DataFrame
+                Relatório com as colunas column, dtype, memory_bytes, cardinality, null_ratio e suggested_dtype
+        """
+        report = []
+        for column in df.columns:
+            series = df[column]
+            # Uma única passada de hash por coluna fornece os nulos (código -1) e a cardinalidade
+            codes, uniques = pd.factorize(series)
+            nulls = int((codes == -1).sum())
+            inferred = None
+            if not (pd.api.types.is_bool_dtype(series.dtype) or pd.api.types.is_numeric_dtype(series.dtype)):
+                inferred = pd.api.types.infer_dtype(series, skipna=True)
+            suggested = PandasDFManipulation._compact_dtype(series, categorical_threshold, nulls > 0, len(uniques),
+                                                            inferred)
+            if use_arrow_strings and suggested in ('object', 'str', 'string') and inferred == 'string':
+                suggested = 'string[pyarrow]'
+            report.append({
+                'column': column,
+                'dtype': str(series.dtype),
+                'memory_bytes': int(series.memory_usage(index=False, deep=True)),
+                'cardinality': len(uniques),
+                'null_ratio': nulls / len(series) if len(series) else 0.0,
+                'suggested_dtype': suggested
+            })
+        report = pd.DataFrame(report, columns=['column', 'dtype', 'memory_bytes', 'cardinality', 'null_ratio',
+                                               'suggested_dtype'])
+        logging.info("Memória total do dataframe: {0:.2f} MB".format(report['memory_bytes'].sum() / 1024 ** 2))
+        return report
+
+    @staticmethod
+    def optimize_memory(df: pd.DataFrame, categorical_threshold: float = 0.5, use_arrow_strings: bool = False):
+        """
+        Função para reduzir a memória do DataFrame aplicando apenas conversões sem perda de informação: inteiros e
+        floats para o menor dtype possível, category para strings de baixa cardinalidade e, opcionalmente,
+        strings do Arrow para as demais colunas string.
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame que será otimizado (alterado no próprio objeto)
+
+            categorical_threshold: float
+                Proporção máxima de valores distintos para que uma coluna string seja convertida para category
+
+            use_arrow_strings: bool
+                Se True, colunas string de alta cardinalidade são convertidas para 'string[pyarrow]'
+                (requer o pyarrow instalado)
+
+        Retorno:
+            df, report: Tuple[pd.DataFrame, pd.DataFrame]
+                Dataframe otimizado e relatório do profile_memory acrescido das colunas optimized_dtype e
+                optimized_memory_bytes
+        """
+        report = PandasDFManipulation.profile_memory(df, categorical_threshold, use_arrow_strings)
+        optimized_dtypes = []
+        optimized_memory = []
+        for column, suggested in zip(report['column'], report['suggested_dtype']):
+            if suggested == 'string[pyarrow]':
+                df[column] = df[column].astype(suggested)
+            else:
+                df[column] = PandasDFManipulation.safe_cast(df[column], suggested)
+            optimized_dtypes.append(str(df[column].dtype))
+            optimized_memory.append(int(df[column].memory_usage(index=False, deep=True)))
+        report['optimized_dtype'] = optimized_dtypes
+        report['optimized_memory_bytes'] = optimized_memory
+        logging.info("Memória do dataframe reduzida de {0:.2f} MB para {1:.2f} MB"
+                     .format(report['memory_bytes'].sum() / 1024 ** 2,
+                             report['optimized_memory_bytes'].sum() / 1024 ** 2))
+        return df, report
+
+    @staticmethod
+    def profile_dataframe(df: pd.DataFrame, top_k: int = 10, max_tracked_values: int = 100000):
+        """
+        Função para gerar o profile de qualidade de um DataFrame (nulos, distintos, mínimo/máximo, tamanho das
+        strings e valores mais frequentes), ver PandasDFProfiler.
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame que será analisado
+
+            top_k: int
+                Quantidade de valores mais frequentes reportados por coluna
+
+            max_tracked_values: int
+                Quantidade máxima de valores distintos mantidos em memória por coluna. Acima dela a contagem de
+                distintos e os valores mais frequentes passam a ser aproximados
+
+        Retorno:
+            report: dict
+                Relatório do profile
+        """
+        profiler = PandasDFProfiler(top_k, max_tracked_values)
+        profiler.update(df)
+        return profiler.report()
+
+    @staticmethod
+    def profile_csv(file, separador: str = ",", chunksize: int = 100000, top_k: int = 10,
+                    max_tracked_values: int = 100000, report_file: str = None, **kwargs):
+        """
+        Função para gerar o profile de qualidade de um CSV lendo-o em chunks, sem carregar o arquivo inteiro.
+
+        Parâmetros:
+            file: str | file-like
+                Caminho do arquivo ou buffer aberto (por exemplo o corpo de um objeto do COS)
+
+            separador: str
+                Separador do arquivo
+
+            chunksize: int
+                Quantidade de linhas lidas por vez
+
+            top_k: int
+                Quantidade de valores mais frequentes reportados por coluna
+
+            max_tracked_values: int
+                Quantidade máxima de valores distintos mantidos em memória por coluna. Acima dela a contagem de
+                distintos e os valores mais frequentes passam a ser aproximados
+
+            report_file: str
+                Se informado, o relatório é gravado em JSON neste caminho (por exemplo ao lado do arquivo)
+
+            kwargs:
+                Parâmetros adicionais repassados ao pd.read_csv
+
+        Retorno:
+            report: dict
+                Relatório do profile
+        """
+        profiler = PandasDFProfiler(top_k, max_tracked_values)
+        for chunk in pd.read_csv(file, sep=separador, chunksize=chunksize, **kwargs):
+            profiler.update(chunk)
+        if report_file:
+            profiler.to_json(report_file)
+        return profiler.report()
+
+    @staticmethod
+    def sample_file(file, n: int, separador: str = ",", strata_column: str = None, chunksize: int = 100000,
+                    random_state: int = None, **kwargs):
+        """
+        Função para extrair uma amostra aleatória de tamanho fixo de um CSV em uma única leitura, sem carregar o
+        arquivo inteiro (memória limitada a n linhas + um chunk). Cada linha recebe uma prioridade aleatória e a
+        amostra é formada pelas n menores prioridades (reservoir sampling); linhas de chunks seguintes só são
+        consideradas se a prioridade for menor que a maior prioridade já mantida.
+
+        Parâmetros:
+            file: str | file-like
+                Caminho do arquivo ou buffer aberto (por exemplo COSManipulation.open_file_stream_cos)
+
+            n: int
+                Tamanho da amostra (por estrato, quando strata_column for informado)
+
+            separador: str
+                Separador do arquivo
+
+            strata_column: str
+                Se informado, a amostragem é estratificada: até n linhas por valor distinto da coluna
+
+            chunksize: int
+                Quantidade de linhas lidas por vez
+
+            random_state: int
+                Semente para amostras reprodutíveis
+
+            kwargs:
+                Parâmetros adicionais repassados ao pd.read_csv
+
+        Retorno:
+            df: pd.DataFrame
+                Amostra na ordem original do arquivo
+        """
+        key_column, row_column = '__sample_key__', '__sample_row__'
+        rng = np.random.default_rng(random_state)
+        sample = None
+        offset = 0
+        for chunk in pd.read_csv(file, sep=separador, chunksize=chunksize, **kwargs):
+            chunk[key_column] = rng.random(len(chunk))
+            chunk[row_column] = np.arange(offset, offset + len(chunk))
+            offset += len(chunk)
+            if sample is not None:
+                # Descarta antes do concat as linhas que não entrariam na amostra
+                if strata_column is None:
+                    if len(sample) >= n:
+                        chunk = chunk[chunk[key_column] < sample[key_column].max()]
+                else:
+                    groups = sample.groupby(strata_column, dropna=False, sort=False)[key_column]
+                    thresholds = groups.max()[groups.size() >= n]
+                    chunk = chunk[chunk[key_column] < chunk[strata_column].map(thresholds).fillna(np.inf)]
+                chunk = pd.concat([sample, chunk], ignore_index=True)
+            if strata_column is None:
+                sample = chunk.nsmallest(n, key_column)
+            else:
+                sample = chunk.sort_values(key_column).groupby(strata_column, dropna=False, sort=False).head(n)
+        if sample is None:
+            return pd.DataFrame()
+        sample = sample.sort_values(row_column).drop(columns=[key_column, row_column]).reset_index(drop=True)
+        logging.info("Amostra de {0} linhas extraída de {1} linhas".format(len(sample), offset))
+        return sample
+
+
+class PandasDFPipeline:
+    """
+    Pipeline que registra uma sequência das operações do PandasDFManipulation e só as executa no run/run_csv.
+    Antes da execução o pipeline é otimizado: apenas as colunas necessárias são lidas, os filtros de linha sobre
+    colunas originais são combinados em uma única máscara aplicada antes das demais operações e as colunas
+    derivadas (join_columns, add_partition_column) são calculadas somente para as linhas restantes.
+
+    Exemplo:
+        pipeline = (PandasDFPipeline()
+                    .drop_nulls_from_column('cliente')
+                    .filter_rows_using_values('estado', 'SP')
+                    .join_columns('cliente', 'produto', 'chave')
+                    .filter_df_using_column_names(['chave', 'valor']))
+        df = pipeline.run(df_origem)
+    """
+
+    def __init__(self):
+        self.operations = []
+
+    def filter_rows_using_values(self, column_name: str, value_filter):
+        """
+        Função para registrar o filtro de linhas que possuem um determinado valor.
+
+        Parâmetros:
+            column_name: String
+                Nome da coluna onde será buscado o valor determinado
+
+            value_filter: String
+                Valor que será filtrado na coluna
+
+        Retorno:
+            pipeline: PandasDFPipeline
+                O próprio pipeline, permitindo encadear as chamadas
+        """
+        self.operations.append(('filter', column_name, value_filter))
+        return self
+
+    def filter_df_using_column_names(self, columns_names: List[str]):
+        """
+        Função para registrar a seleção de colunas do DataFrame.
+
+        Parâmetros:
+            columns_names: List[str]
+                Lista das colunas que serão mantidas
+
+        Retorno:
+            pipeline: PandasDFPipeline
+                O próprio pipeline, permitindo encadear as chamadas
+        """
+        self.operations.append(('select', list(columns_names)))
+        return self
+
+    def join_columns(self, column_1: str, column_2: str, composted_column: str):
+        """
+        Função para registrar a criação de uma coluna unindo as informações de outras (duas) colunas.
+
+        Parâmetros:
+            column_1: String
+                Primeira coluna que será utilizada para criar a coluna composta
+
+            column_2: String
+                Segunda coluna que será utilizada para criar a coluna composta
+
+            composted_column: String
+                Nome da coluna composta criada
+
+        Retorno:
+            pipeline: PandasDFPipeline
+                O próprio pipeline, permitindo encadear as chamadas
+        """
+        self.operations.append(('join', column_1, column_2, composted_column))
+        return self
+
+    def drop_nulls_from_column(self, column: str):
+        """
+        Função para registrar a remoção dos registros nulos da coluna informada.
+
+        Parâmetros:
+            column: String
+                Coluna onde será buscado o null
+
+        Retorno:
+            pipeline: PandasDFPipeline
+                O próprio pipeline, permitindo encadear as chamadas
+        """
+        self.operations.append(('notnull', column))
+        return self
+
+    def add_partition_column(self):
+        """
+        Função para registrar a adição da coluna de particionamento (dataIngestao).
+
+        Parâmetros:
+            Sem parâmetros
+
+        Retorno:
+            pipeline: PandasDFPipeline
+                O próprio pipeline, permitindo encadear as chamadas
+        """
+        self.operations.append(('partition',))
+        return self
+
+    def plan(self, columns):
+        """
+        Função para montar o plano de execução otimizado a partir das colunas do DataFrame de origem.
+
+        Parâmetros:
+            columns: List[str]
+                Colunas do DataFrame (ou arquivo) de origem
+
+        Retorno:
+            plan: dict
+                Dicionário com as colunas de origem necessárias ('base_columns'), os filtros aplicados sobre
+                colunas de origem ('base_filters'), as operações executadas após o filtro ('derived_operations')
+                e as colunas do resultado final ('columns')
+        """
+        available = list(columns)
+        derived = set()
+        needed = set()
+        base_filters = []
+        derived_operations = []
+        for operation in self.operations:
+            kind = operation[0]
+            if kind == 'select':
+                available = [column for column in operation[1] if column in available]
+                continue
+            if kind == 'partition':
+                inputs, output = [], 'dataIngestao'
+            elif kind == 'join':
+                inputs, output = [operation[1], operation[2]], operation[3]
+            else:
+                inputs, output = [operation[1]], None
+            for column in inputs:
+                if column not in available:
+                    raise KeyError(column)
+            if output is None and operation[1] not in derived:
+                base_filters.append(operation)
+                needed.add(operation[1])
+                continue
+            needed.update(column for column in inputs if column not in derived)
+            derived_operations.append(operation)
+            if output is not None:
+                derived.add(output)
+                if output not in available:
+                    available.append(output)
+
+        needed.update(column for column in available if column not in derived)
+        return {
+            'base_columns': [column for column in columns if column in needed],
+            'base_filters': base_filters,
+            'derived_operations': derived_operations,
+            'columns': available
+        }
+
+    @staticmethod
+    def execute(df: pd.DataFrame, plan: dict, partition_value: str):
+        """
+        Função para executar um plano montado pelo plan sobre um DataFrame (ou um chunk de um arquivo).
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame de origem
+
+            plan: dict
+                Plano de execução retornado pelo plan
+
+            partition_value: String
+                Valor utilizado na coluna de particionamento
+
+        Retorno:
+            df: pd.DataFrame
+                Dataframe resultante do pipeline
+        """
+        # Em dtypes nullable (Int64, boolean, string) a comparação retorna pd.NA, tratado como não correspondente
+        mask = None
+        for operation in plan['base_filters']:
+            if operation[0] == 'filter':
+                condition = (df[operation[1]] == operation[2]).to_numpy(dtype=bool, na_value=False)
+            else:
+                condition = df[operation[1]].notna().to_numpy(dtype=bool, na_value=False)
+            mask = condition if mask is None else mask & condition
+        df = df.loc[mask if mask is not None else slice(None), plan['base_columns']]
+
+        for operation in plan['derived_operations']:
+            kind = operation[0]
+            if kind == 'join':
+                df[operation[3]] = df[operation[1]].astype(str) + df[operation[2]].astype(str)
+            elif kind == 'partition':
+                df['dataIngestao'] = partition_value
+            elif kind == 'filter':
+                df = df.loc[(df[operation[1]] == operation[2]).to_numpy(dtype=bool, na_value=False)]
+            else:
+                df = df.loc[df[operation[1]].notna().to_numpy(dtype=bool, na_value=False)]
+        return df[plan['columns']]
+
+    def run(self, df: pd.DataFrame):
+        """
+        Função para executar o pipeline sobre um DataFrame.
+
+        Parâmetros:
+            df: pd.DataFrame
+                DataFrame de origem (não é alterado)
+
+        Retorno:
+            df: pd.DataFrame
+                Dataframe resultante do pipeline
+        """
+        plan = self.plan(df.columns)
+        logging.info("Executando pipeline com o plano: {0}".format(plan))
+        return PandasDFPipeline.execute(df, plan, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+    def run_csv(self, file: str, separador: str = ",", chunksize: int = 100000):
+        """
+        Função para executar o pipeline sobre um arquivo CSV, processando um chunk por vez. Apenas as colunas
+        necessárias para o pipeline são lidas do arquivo (usecols).
+
+        Parâmetros:
+            file: String
+                Caminho completo para o arquivo csv
+
+            separador: String
+                Delimitador de colunas utilizado no arquivo, ex: (',', ';')
+
+            chunksize: int
+                Quantidade de linhas lidas do arquivo em cada chunk
+
+        Retorno:
+            generator: DataFrames resultantes do pipeline para cada chunk (utilize pd.concat para unificá-los)
+        """
+        columns = pd.read_csv(file, sep=separador, nrows=0).columns
+        plan = self.plan(columns)
+        logging.info("Executando pipeline no arquivo {0} com o plano: {1}".format(file, plan))
+        partition_value = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        usecols = plan['base_columns'] or None
+        for chunk in pd.read_csv(file, sep=separador, usecols=usecols, chunksize=chunksize):
+            yield PandasDFPipeline.execute(chunk, plan, partition_value)
+
+
+class PandasDFValueIndex:
+    """
+    Índice de valores de uma coluna de um DataFrame. A coluna é percorrida uma única vez (pd.factorize) e as
+    posições das linhas são agrupadas por valor, de forma que cada consulta custa apenas a cópia das linhas
+    retornadas. Valores nulos são agrupados e podem ser consultados com None.
+
+    Exemplo:
+        index = PandasDFManipulation.create_value_index(df, 'cliente')
+        for cliente, df_cliente in index.groups():
+            df_cliente.to_csv(f'files/refined/clientes/{cliente}.csv', index=False)
+    """
+
+    def __init__(self, df: pd.DataFrame, column_name: str):
+        self.df = df
+        self.column_name = column_name
+        codes, uniques = pd.factorize(df[column_name])
+        # Nulos recebem o código -1 no factorize, aqui eles passam a ser o último grupo
+        self.null_code = len(uniques)
+        codes = np.where(codes == -1, self.null_code, codes)
+        self.values = list(uniques)
+        self.codes_by_value = {value: code for code, value in enumerate(self.values)}
+        self.positions = np.argsort(codes, kind='stable')
+        self.offsets = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=self.null_code + 1))))
+
+    def _code(self, value):
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return self.null_code
+        return self.codes_by_value.get(value)
+
+    def _positions(self, code):
+        return self.positions[self.offsets[code]:self.offsets[code + 1]]
+
+    def get(self, value):
+        """
+        Função para retornar as linhas que possuem o valor informado.
+
+        Parâmetros:
+            value: Any
+                Valor buscado na coluna (None para as linhas nulas)
+
+        Retorno:
+            df: pd.DataFrame
+                Dataframe com as linhas contendo o valor, na ordem original
+        """
+        code = self._code(value)
+        if code is None:
+            return self.df.iloc[0:0]
+        return self.df.iloc[self._positions(code)]
+
+    def get_many(self, values: List):
+        """
+        Função para retornar as linhas que possuem qualquer um dos valores informados.
+
+        Parâmetros:
+            values: List
+                Valores buscados na coluna
+
+        Retorno:
+            df: pd.DataFrame
+                Dataframe com as linhas contendo algum dos valores, na ordem original
+        """
+        codes = {self._code(value) for value in values} - {None}
+        if not codes:
+            return self.df.iloc[0:0]
+        positions = np.concatenate([self._positions(code) for code in codes])
+        return self.df.iloc[np.sort(positions)]
+
+    def groups(self, dropna: bool = True):
+        """
+        Função para percorrer todos os grupos da coluna.
+
+        Parâmetros:
+            dropna: bool
+                Se True (default), o grupo de valores nulos não é retornado
+
+        Retorno:
+            generator: Tuplas (valor, df) para cada valor distinto da coluna
+        """
+        for code, value in enumerate(self.values):
+            yield value, self.df.iloc[self._positions(code)]
+        if not dropna and self.offsets[-1] > self.offsets[-2]:
+            yield None, self.df.iloc[self._positions(self.null_code)]
+
+
+class PandasDFProfiler:
+    """
+    Profile de qualidade de colunas calculado por chunks. Cada coluna do chunk é percorrida uma única vez
+    (value_counts) e todas as estatísticas são derivadas dos valores distintos e suas contagens, de forma que
+    profiles parciais (por chunk, arquivo ou processo) podem ser combinados com merge.
+
+    Para limitar a memória, cada coluna mantém no máximo max_tracked_values valores distintos; acima disso
+    somente os mais frequentes são mantidos e a contagem de distintos passa a ser um limite inferior
+    (distinct_exact = False). A partir desse ponto os valores mais frequentes e suas contagens também passam a ser
+    aproximados, pois as ocorrências de um valor descartado em um chunk são perdidas se ele voltar a aparecer nos
+    chunks seguintes. Mínimo, máximo e tamanho das strings continuam exatos; se os valores da coluna não puderem
+    ser comparados entre si (ex: números e textos), mínimo e máximo são None, mesmo que apenas um dos profiles
+    combinados tenha valores não comparáveis.
+
+    Exemplo:
+        profiler = PandasDFProfiler()
+        for chunk in pd.read_csv('files/raw/vendas.csv', chunksize=100000):
+            profiler.update(chunk)
+        profiler.to_json('files/raw/vendas.profile.json')
+    """
+
+    def __init__(self, top_k: int = 10, max_tracked_values: int = 100000):
+        self.top_k = top_k
+        self.max_tracked_values = max_tracked_values
+        self.rows = 0
+        self.columns = {}
+
+    @staticmethod
+    def _combine(current, value, function):
+        # None indica apenas a ausência de valores; valores não comparáveis levantam TypeError
+        if current is None:
+            return value
+        if value is None:
+            return current
+        return function(current, value)
+
+    def _partial(self, series: pd.Series):
+        counts = series.value_counts(dropna=True, sort=False)
+        counts = counts[counts > 0]
+        if isinstance(counts.index, pd.CategoricalIndex):
+            counts.index = counts.index.astype(object)
+        partial = {
+            'dtype': str(series.dtype),
+            'nulls': int(len(series) - counts.sum()),
+            'counts': counts,
+            'exact': True,
+            'comparable': True,
+            'min': None,
+            'max': None,
+            'length_min': None,
+            'length_max': None,
+            'length_sum': 0,
+            'length_count': 0
+        }
+        if len(counts):
+            try:
+                partial['min'] = counts.index.min()
+                partial['max'] = counts.index.max()
+            except TypeError:
+                partial['comparable'] = False
+        if len(counts) and (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+                            or isinstance(series.dtype, pd.CategoricalDtype)):
+            values = pd.Series(counts.index, dtype=object)
+            is_string = values.map(type).eq(str).to_numpy()
+            if is_string.any():
+                lengths = values[is_string].str.len().astype('int64').to_numpy()
+                weights = counts.to_numpy()[is_string]
+                partial['length_min'] = int(lengths.min())
+                partial['length_max'] = int(lengths.max())
+                partial['length_sum'] = int((lengths * weights).sum())
+                partial['length_count'] = int(weights.sum())
+        return self._trim(partial)
+
+    def _trim(self, partial: dict):
+        if len(partial['counts']) > self.max_tracked_values:
+            partial['counts'] = partial['counts'].nlargest(self.max_tracked_values)
+            partial['exact'] = False
+        return partial
+
+    def _merge_column(self, current: dict, partial: dict):
+        if current is None:
+            return partial
+        dtypes = set(current['dtype'].split('|')) | set(partial['dtype'].split('|'))
+        current['dtype'] = '|'.join(sorted(dtypes))
+        current['nulls'] += partial['nulls']
+        try:
+            current['counts'] = current['counts'].add(partial['counts'], fill_value=0).astype('int64')
+        except TypeError:
+            counts = pd.concat([current['counts'], partial['counts']])
+            current['counts'] = counts.groupby(level=0, sort=False).sum()
+        current['exact'] = current['exact'] and partial['exact']
+        # Uma vez não comparáveis, mínimo e máximo permanecem None em todos os merges seguintes
+        current['comparable'] = current['comparable'] and partial['comparable']
+        if current['comparable']:
+            try:
+                current['min'] = self._combine(current['min'], partial['min'], min)
+                current['max'] = self._combine(current['max'], partial['max'], max)
+            except TypeError:
+                current['comparable'] = False
+        if not current['comparable']:
+            current['min'] = current['max'] = None
+        current['length_min'] = self._combine(current['length_min'], partial['length_min'], min)
+        current['length_max'] = self._combine(current['length_max'], partial['length_max'], max)
+        current['length_sum'] += partial['length_sum']
+        current['length_count'] += partial['length_count']
+        return self._trim(current)
+
+    def update(self, df: pd.DataFrame):
+        """
+        Função para acrescentar um chunk ao profile.
+
+        Parâmetros:
+            df: pd.DataFrame
+                Chunk de dados
+
+        Retorno:
+            self: PandasDFProfiler
+        """
+        self.rows += len(df)
+        for column in df.columns:
+            self.columns[column] = self._merge_column(self.columns.get(column), self._partial(df[column]))
+        return self
+
+    def merge(self, other: 'PandasDFProfiler'):
+        """
+        Função para combinar o profile parcial de outro PandasDFProfiler neste profile.
+
+        Parâmetros:
+            other: PandasDFProfiler
+                Profile parcial (por exemplo de outro arquivo ou processo)
+
+        Retorno:
+            self: PandasDFProfiler
+        """
+        self.rows += other.rows
+        for column, partial in other.columns.items():
+            partial = dict(partial, counts=partial['counts'].copy())
+            self.columns[column] = self._merge_column(self.columns.get(column), partial)
+        return self
+
+    @staticmethod
+    def _to_builtin(value):
+        if value is None:
+            return None
+        if isinstance(value, (pd.Timestamp, datetime)):
+            return value.isoformat()
+        if hasattr(value, 'item'):
+            return value.item()
+        return value
+
+    def report(self):
+        """
+        Função para gerar o relatório compacto do profile, serializável em JSON.
+
+        Retorno:
+            report: dict
+                {'rows': int, 'columns': {coluna: {'dtype', 'nulls', 'null_ratio', 'distinct', 'distinct_exact',
+                'min', 'max', 'length_min', 'length_max', 'length_mean', 'top'}}}
+        """
+        columns = {}
+        for column, stats in self.columns.items():
+            counts = stats['counts']
+            try:
+                # Empates no top-k são desempatados pelo valor, para o relatório não depender da ordem dos chunks
+                counts = counts.sort_index()
+            except TypeError:
+                # Valores não comparáveis entre si são ordenados pelo tipo e pelo texto
+                order = sorted(range(len(counts)),
+                               key=lambda position: (type(counts.index[position]).__name__,
+                                                     str(counts.index[position])))
+                counts = counts.iloc[order]
+            top = counts.nlargest(self.top_k)
+            columns[str(column)] = {
+                'dtype': stats['dtype'],
+                'nulls': stats['nulls'],
+                'null_ratio': round(stats['nulls'] / self.rows, 6) if self.rows else 0.0,
+                'distinct': int(len(stats['counts'])),
+                'distinct_exact': stats['exact'],
+                'min': self._to_builtin(stats['min']),
+                'max': self._to_builtin(stats['max']),
+                'length_min': stats['length_min'],
+                'length_max': stats['length_max'],
+                'length_mean': round(stats['length_sum'] / stats['length_count'], 3)
+                if stats['length_count'] else None,
+                'top': [[self._to_builtin(value), int(count)] for value, count in top.items()]
+            }
+        return {'rows': self.rows, 'columns': columns}
+
+    def to_json(self, file: str):
+        """
+        Função para gravar o relatório do profile em JSON de forma atômica.
+
+        Parâmetros:
+            file: str
+                Caminho do arquivo JSON
+        """
+        directory = os.path.dirname(file) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, default=str)
+        os.replace(tmp_file, file)
+        logging.info("Profile gravado em {0}".format(file))
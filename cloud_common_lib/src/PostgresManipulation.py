@@ -1,17 +1,21 @@
+from __future__ import annotations
+
 import logging
 import os
 import re
-import pandas as pd
-import sqlalchemy
-from sqlalchemy import engine
-from sqlalchemy.orm import close_all_sessions
+from typing import TYPE_CHECKING
 
+try:
+    from .Utils import Utils
+except ImportError:
+    from Utils import Utils
 
-import logging
-import os
-import re
-import sqlalchemy
-from sqlalchemy.engine import Engine
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+# Dependências carregadas apenas no primeiro uso (ver Utils.lazy_import)
+pd = Utils.lazy_import('pandas')
+sqlalchemy = Utils.lazy_import('sqlalchemy')
 
 
 class PostgresManipulation:
@@ -309,6 +313,8 @@ class PostgresManipulation:
             message: void
                 Mensagem informando que as sessões foram encerradas
         """
+        from sqlalchemy.orm import close_all_sessions
+
         close_all_sessions()
         logging.info('Todas as sessões foram finalizadas com sucesso!')
 
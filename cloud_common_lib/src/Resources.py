@@ -0,0 +1,140 @@
+import importlib
+import logging
+import threading
+
+
+def _import_class(name: str):
+    # Os módulos dos backends só são importados aqui, no primeiro acesso ao recurso
+    module = importlib.import_module(f"{__package__}.{name}" if __package__ else name)
+    return getattr(module, name)
+
+
+def _create_cos():
+    return _import_class('COSManipulation')()
+
+
+def _create_mongo():
+    mongo = _import_class('MongoManipulation')()
+    mongo.initiate_connection()
+    return mongo
+
+
+def _close_mongo(mongo):
+    mongo.disconnect()
+
+
+def _create_postgres():
+    postgres = _import_class('PostgresManipulation')()
+    postgres.connect_postgres()
+    return postgres
+
+
+def _close_postgres(postgres):
+    postgres.disconnect_pg()
+    postgres.engine.dispose()
+
+
+class Resources:
+    """
+    Registro de conexões abertas sob demanda: o módulo de cada backend (e suas dependências) só é importado e a
+    conexão só é aberta no primeiro acesso, de forma que um job que utiliza apenas o COS não paga a importação e a
+    conexão do MongoDB e do PostgreSQL. Cada recurso é criado uma única vez por registro, mesmo com acessos
+    simultâneos de várias threads.
+
+    Exemplo:
+        with Resources() as resources:
+            df = resources.cos.create_dataframe_from_file_on_cos('raw/vendas.csv')
+            resources.postgres.insert_data_into_postgres_from_df(df, 'exploratory', 'vendas')
+        # As conexões abertas são encerradas ao sair do bloco
+    """
+
+    def __init__(self):
+        self._factories = {}
+        self._instances = {}
+        self._lock = threading.Lock()
+        self.register('cos', _create_cos)
+        self.register('mongo', _create_mongo, _close_mongo)
+        self.register('postgres', _create_postgres, _close_postgres)
+
+    def register(self, name: str, factory, closer=None):
+        """
+        Função para registrar (ou substituir) um recurso.
+
+        Parâmetros:
+            name (str): Nome do recurso.
+            factory (callable): Função sem parâmetros que cria o recurso já conectado.
+            closer (callable): Função que recebe o recurso e encerra a conexão. Opcional.
+
+        Retorno:
+            None
+        """
+        self._factories[name] = (factory, closer)
+
+    def get(self, name: str):
+        """
+        Função para retornar o recurso informado, criando-o no primeiro acesso.
+
+        Parâmetros:
+            name (str): Nome do recurso, ex: 'cos', 'mongo' ou 'postgres'.
+
+        Retorno:
+            object: Recurso conectado.
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        if name not in self._factories:
+            raise Exception('Os recursos registrados são: {0}'.format(list(self._factories)))
+        with self._lock:
+            if name not in self._instances:
+                logging.info("Abrindo o recurso {0}".format(name))
+                self._instances[name] = self._factories[name][0]()
+            return self._instances[name]
+
+    def is_open(self, name: str) -> bool:
+        """
+        Função para verificar se o recurso informado já foi criado.
+        """
+        return name in self._instances
+
+    @property
+    def cos(self):
+        return self.get('cos')
+
+    @property
+    def mongo(self):
+        return self.get('mongo')
+
+    @property
+    def postgres(self):
+        return self.get('postgres')
+
+    def close(self, name: str = None):
+        """
+        Função para encerrar o recurso informado ou, se não informado, todos os recursos abertos.
+
+        Parâmetros:
+            name (str): Nome do recurso. Opcional.
+
+        Retorno:
+            None
+        """
+        with self._lock:
+            names = [name] if name else list(self._instances)
+            for resource_name in names:
+                instance = self._instances.pop(resource_name, None)
+                if instance is None:
+                    continue
+                closer = self._factories[resource_name][1]
+                if closer is not None:
+                    try:
+                        closer(instance)
+                    except Exception as e:
+                        logging.error("Não foi possível encerrar o recurso {0}: {1}".format(resource_name, e))
+                logging.info("Recurso {0} encerrado".format(resource_name))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
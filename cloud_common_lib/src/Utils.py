@@ -1,11 +1,36 @@
+import fnmatch
+import importlib.util
 import logging
 import glob
 import os
+import re
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from types import ModuleType
+
+
+class _LazyModule(ModuleType):
+    """
+    Módulo substituto retornado pelo Utils.lazy_import.
+    """
+
+    _lock = threading.RLock()
+
+    def __getattr__(self, attribute):
+        # Só é chamado para atributos ainda não copiados, ou seja, até o primeiro carregamento
+        with _LazyModule._lock:
+            if '_module' not in self.__dict__:
+                module = importlib.import_module(self.__name__)
+                self.__dict__.update(module.__dict__)
+                self.__dict__['_module'] = module
+        return getattr(self.__dict__['_module'], attribute)
 
 
 class Utils:
     @staticmethod
-    def return_files_of_directory(directory=".", regex="*", extension="*"):
+    def return_files_of_directory(directory=".", regex="*", extension="*", recursive=False):
         """
         Função para retornar a lista de arquivos em um diretório que correspondem ao padrão fornecido.
 
@@ -13,15 +38,165 @@ class Utils:
             directory (str): Diretório onde os arquivos serão procurados. Padrão é o diretório atual (".").
             regex (str): Padrão para filtrar os arquivos. Padrão é "*".
             extension (str): Extensão dos arquivos a serem filtrados. Padrão é "*".
+            recursive (bool): Se True, procura também nos subdiretórios (via walk_files). Padrão é False.
 
         Retorno:
             list: Lista de arquivos que correspondem ao padrão fornecido.
         """
         logging.info(f"Retornando a lista de arquivos do diretório: {directory}")
 
+        if recursive:
+            return list(Utils.walk_files(directory, include=f"{regex}.{extension}", exclude=".*"))
         list_of_files = glob.glob(os.path.join(directory, f"{regex}.{extension}"))
         return list_of_files
 
+    @staticmethod
+    def _compile_patterns(patterns):
+        if patterns is None:
+            return None, None
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        name_patterns = [fnmatch.translate(p) for p in patterns if '/' not in p]
+        path_patterns = [fnmatch.translate(p) for p in patterns if '/' in p]
+        return (re.compile('|'.join(name_patterns)) if name_patterns else None,
+                re.compile('|'.join(path_patterns)) if path_patterns else None)
+
+    @staticmethod
+    def _match_patterns(compiled, name, relative_path):
+        name_regex, path_regex = compiled
+        return bool((name_regex and name_regex.match(name)) or (path_regex and path_regex.match(relative_path)))
+
+    @staticmethod
+    def _scan_directory(path, relative_path, include, exclude, filters, need_stat, recursive):
+        files, directories = [], []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    relative_entry = f"{relative_path}/{entry.name}" if relative_path else entry.name
+                    if exclude and Utils._match_patterns(exclude, entry.name, relative_entry):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            directories.append((entry.path, relative_entry))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    if include and not Utils._match_patterns(include, entry.name, relative_entry):
+                        continue
+                    stat = None
+                    if need_stat:
+                        stat = entry.stat()
+                        min_size, max_size, modified_after, modified_before = filters
+                        if (min_size is not None and stat.st_size < min_size) \
+                                or (max_size is not None and stat.st_size > max_size) \
+                                or (modified_after is not None and stat.st_mtime < modified_after) \
+                                or (modified_before is not None and stat.st_mtime >= modified_before):
+                            continue
+                    files.append((entry.path, stat))
+        except OSError as e:
+            logging.warning(f"Não foi possível ler o diretório {path}: {e}")
+        return files, directories
+
+    @staticmethod
+    def walk_files(directory=".", recursive=True, include=None, exclude=None, min_size=None, max_size=None,
+                   modified_after=None, modified_before=None, with_stat=False, max_workers=None):
+        """
+        Função para percorrer os arquivos de um diretório com os.scandir, retornando os caminhos conforme são
+        encontrados (generator), sem montar a lista completa em memória.
+
+        Parâmetros:
+            directory (str): Diretório raiz. Padrão é o diretório atual (".").
+            recursive (bool): Se True, percorre também os subdiretórios. Padrão é True.
+            include (str | list): Padrões (fnmatch) que os arquivos devem atender, ex: "*.csv". Padrões com "/"
+                são comparados com o caminho relativo à raiz, os demais apenas com o nome.
+            exclude (str | list): Padrões (fnmatch) de arquivos e diretórios ignorados; diretórios excluídos não
+                são percorridos.
+            min_size (int): Tamanho mínimo do arquivo em bytes.
+            max_size (int): Tamanho máximo do arquivo em bytes.
+            modified_after (datetime | float): Apenas arquivos modificados a partir desta data.
+            modified_before (datetime | float): Apenas arquivos modificados antes desta data.
+            with_stat (bool): Se True, retorna tuplas (caminho, os.stat_result).
+            max_workers (int): Se informado, os subdiretórios são lidos em paralelo com este número de threads
+                (a ordem dos resultados deixa de ser determinística).
+
+        Retorno:
+            generator: Caminhos dos arquivos (ou tuplas (caminho, stat) quando with_stat=True).
+        """
+        if isinstance(modified_after, datetime):
+            modified_after = modified_after.timestamp()
+        if isinstance(modified_before, datetime):
+            modified_before = modified_before.timestamp()
+        filters = (min_size, max_size, modified_after, modified_before)
+        need_stat = with_stat or any(value is not None for value in filters)
+        options = (Utils._compile_patterns(include) if include is not None else None,
+                   Utils._compile_patterns(exclude) if exclude is not None else None,
+                   filters, need_stat, recursive)
+
+        if not max_workers:
+            pending = [(directory, "")]
+            while pending:
+                path, relative_path = pending.pop()
+                files, directories = Utils._scan_directory(path, relative_path, *options)
+                for file, stat in files:
+                    yield (file, stat) if with_stat else file
+                pending.extend(reversed(directories))
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(Utils._scan_directory, directory, "", *options)}
+            while futures:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, directories = future.result()
+                    for path, relative_path in directories:
+                        futures.add(executor.submit(Utils._scan_directory, path, relative_path, *options))
+                    for file, stat in files:
+                        yield (file, stat) if with_stat else file
+
+    @staticmethod
+    def lazy_import(name: str):
+        """
+        Função para importar um módulo de forma preguiçosa: é retornado um módulo substituto e o import real só é
+        executado no primeiro acesso a um de seus atributos. Utilizada para que importar a biblioteca não carregue
+        dependências pesadas (pandas, pymongo, sqlalchemy, ibm_boto3, cryptography) que o job pode nem utilizar.
+
+        O primeiro acesso é protegido por um lock, de forma que várias threads podem utilizar o módulo ao mesmo
+        tempo (o importlib.util.LazyLoader não é thread-safe antes do Python 3.12).
+
+        Se o pacote não estiver instalado, o ModuleNotFoundError é levantado na chamada, como em um import comum.
+        Para submódulos (ex: "bson.json_util") apenas o pacote de primeiro nível é verificado na chamada, sem
+        importá-lo; um submódulo inexistente levanta o erro no primeiro uso.
+
+        Parâmetros:
+            name (str): Nome completo do módulo, ex: "pandas".
+
+        Retorno:
+            module: Módulo (carregado no primeiro uso).
+        """
+        if name in sys.modules:
+            return sys.modules[name]
+        # O find_spec de um submódulo importaria os pacotes pai, por isso apenas o primeiro nível é verificado
+        package = name.split('.')[0]
+        if importlib.util.find_spec(package) is None:
+            raise ModuleNotFoundError(f"No module named '{package}'", name=package)
+        return _LazyModule(name)
+
+    @staticmethod
+    def require_module(name: str, extra: str):
+        """
+        Função para verificar se uma dependência opcional está instalada, sem importá-la.
+
+        Parâmetros:
+            name (str): Nome do módulo, ex: "pyarrow".
+            extra (str): Extra do pacote que instala a dependência, ex: "parquet".
+
+        Retorno:
+            None
+        """
+        if importlib.util.find_spec(name) is None:
+            raise ImportError(f"O módulo {name} não está instalado. Instale com: pip install cloud_common_lib[{extra}]",
+                              name=name)
+
     @staticmethod
     def create_ssl_file(env_var: str, local_filename: str):
         """
@@ -1,13 +1,10 @@
 import logging
 import os
-import pandas as pd
 
-from src.COSManipulation import COSManipulation
 from src.Logging import Logging
-from src.MongoManipulation import MongoManipulation
 from src.FileManipulation import FileManipulation
 from src.PandasDFManipulation import PandasDFManipulation
-from src.PostgresManipulation import PostgresManipulation
+from src.Resources import Resources
 from src.Utils import Utils
 
 class Main:
@@ -17,19 +14,18 @@ class Main:
     @staticmethod
     def run():
         Logging.initiate_log(log_file_mode='w', log_handle_mode='y')
-        cos_manipulation = COSManipulation()
-        
-        mongo_manipulation = MongoManipulation()
-        mongo_manipulation.initiate_connection()
-
-        file_manipulation = FileManipulation()
-
-        pandas_manipulation = PandasDFManipulation()
-        
-        postgres_manipulation = PostgresManipulation()
-        postgres_manipulation.connect_postgres()
-        
-        utils = Utils()
+
+        # COS, MongoDB e PostgreSQL são importados e conectados apenas no primeiro acesso:
+        # resources.cos, resources.mongo e resources.postgres
+        with Resources() as resources:
+            logging.info(resources.cos.get_bucket_contents_cos())
+            logging.info(resources.mongo.list_collections_mongo())
+
+            file_manipulation = FileManipulation()
+
+            pandas_manipulation = PandasDFManipulation()
+
+            utils = Utils()
 
 if __name__ == '__main__':
     main = Main()